@@ -288,6 +288,9 @@ DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", "noreply@example.com")
 # WARNING: the fallback "noreply@example.com" is not a real verified sender.
 # Always set DEFAULT_FROM_EMAIL explicitly in production/staging env vars.
 EMAIL_TIMEOUT = int(os.getenv("EMAIL_TIMEOUT", "10"))
+# Send new-submission emails from a background thread so the applicant's response
+# doesn't wait on SMTP/Resend. Off under pytest so tests can inspect mail.outbox.
+EMAIL_ASYNC = os.getenv("EMAIL_ASYNC", "false" if IS_TESTING else "true").lower() == "true"
 
 # Absolute base URL — fallback for local dev. In production set all three explicitly.
 # APP_BASE_URL  → production app  (e.g. https://app.mypontora.com)
@@ -52,15 +52,14 @@ def _school_aware_has_permission(request):
         # Staff without school membership (shouldn't happen, but allow Django's default)
         return True
 
-    # Resolve the school
+    # Resolve the school's active flag (None means the school no longer exists)
     from core.models import School
-    try:
-        school = School.objects.get(id=school_id)
-    except School.DoesNotExist:
+    is_active = School.objects.filter(id=school_id).values_list("is_active", flat=True).first()
+    if is_active is None:
         return False
 
     # If school is inactive, block access EXCEPT billing and logout
-    if not school.is_active:
+    if not is_active:
         path = request.path
         # Allow billing pages (so they can re-subscribe) and logout
         if path.startswith('/admin/billing') or path.startswith('/admin/logout'):
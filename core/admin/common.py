@@ -6,7 +6,7 @@ from typing import Any
 from django.contrib import admin
 from django.contrib.auth.models import Group
 
-from core.services.config_loader import get_forms, load_school_config
+from core.services.config_loader import config_memo, get_forms, load_school_config
 
 
 # ----------------------------
@@ -42,6 +42,19 @@ def _has_school_membership(user) -> bool:
     return _membership_school_id(user) is not None
 
 
+def _request_membership_school_id(request):
+    """
+    _membership_school_id(request.user), memoized on the request.
+
+    Several admin hooks ask for it while rendering one page; only the first
+    call hits the database.
+    """
+    cache = request.__dict__
+    if "_membership_school_id" not in cache:
+        cache["_membership_school_id"] = _membership_school_id(request.user)
+    return cache["_membership_school_id"]
+
+
 def _bytes_to_mb(size: int) -> str:
     try:
         b = int(size or 0)
@@ -88,6 +101,25 @@ def _orig_key(dyn_key: str) -> str:
 def _resolve_submission_form_cfg_and_labels(
     cfg: Any,
     submission_form_key: str | None,
+) -> tuple[dict, dict[str, str]]:
+    """
+    Memoized wrapper around _compute_submission_form_cfg_and_labels.
+
+    Cached on the shared SchoolConfig per form key (see config_memo), so
+    log_change, attachments, yaml_form and save_model stop re-walking the YAML
+    for every submission of the same school. Callers must treat the result as
+    read-only.
+    """
+    if not cfg:
+        return {}, {}
+
+    fk = (submission_form_key or "").strip()
+    return config_memo(cfg, ("admin_form_labels", fk), lambda: _compute_submission_form_cfg_and_labels(cfg, fk))
+
+
+def _compute_submission_form_cfg_and_labels(
+    cfg: Any,
+    submission_form_key: str | None,
 ) -> tuple[dict, dict[str, str]]:
     """
     Resolve the YAML form config and label map for a submission in admin.
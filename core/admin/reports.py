@@ -31,7 +31,8 @@ def admin_reports_hub_view(request):
     if not school_id:
         raise Http404("Page not found")
 
-    school = School.objects.filter(id=school_id).first()
+    # The hub only renders slug + display_name; skip hydrating the rest of the row.
+    school = School.objects.filter(id=school_id).only("slug", "display_name").first()
     if not school:
         raise Http404("Page not found")
 
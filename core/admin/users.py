@@ -4,11 +4,12 @@ from __future__ import annotations
 from django import forms
 from django.contrib import admin
 from django.contrib.auth import get_user_model
+from django.contrib.admin.widgets import ForeignKeyRawIdWidget
 from django.contrib.auth.admin import UserAdmin as DjangoUserAdmin
 from django.contrib.auth.forms import UserCreationForm
 
 from core.admin.audit import log_admin_audit
-from core.admin.common import _has_school_membership, _is_superuser, _membership_school_id
+from core.admin.common import _is_superuser, _request_membership_school_id
 from core.models import School, SchoolAdminMembership
 
 UserModel = get_user_model()
@@ -19,11 +20,24 @@ except admin.sites.NotRegistered:
     pass
 
 
+def _school_raw_id_widget() -> ForeignKeyRawIdWidget:
+    """
+    Raw-id input (with the admin lookup popup) for the school picker.
+
+    A plain Select renders one <option> per school on every add/change page;
+    this only looks up the selected school. The field queryset is still used
+    for validation.
+    """
+    rel = SchoolAdminMembership._meta.get_field("school").remote_field
+    return ForeignKeyRawIdWidget(rel, admin.site)
+
+
 class UserSuperuserForm(forms.ModelForm):
     school = forms.ModelChoiceField(
         queryset=School.objects.all().order_by("display_name", "slug"),
         required=False,
         help_text="Links this user to a school for school-scoped admin access.",
+        widget=_school_raw_id_widget(),
     )
 
     class Meta:
@@ -46,9 +60,13 @@ class UserSuperuserForm(forms.ModelForm):
             self.fields["email"].required = True
 
         if self.instance and self.instance.pk:
-            current_school_id = _membership_school_id(self.instance)
-            if current_school_id:
-                self.fields["school"].initial = School.objects.filter(id=current_school_id).first()
+            membership = (
+                SchoolAdminMembership.objects.filter(user=self.instance, is_active=True)
+                .select_related("school")
+                .first()
+            )
+            if membership:
+                self.fields["school"].initial = membership.school
 
 
 class UserSuperuserAddForm(UserCreationForm):
@@ -56,6 +74,7 @@ class UserSuperuserAddForm(UserCreationForm):
         queryset=School.objects.all().order_by("display_name", "slug"),
         required=False,
         help_text="Assign this user to a school (creates SchoolAdminMembership and sets is_staff=True).",
+        widget=_school_raw_id_widget(),
     )
 
     class Meta(UserCreationForm.Meta):
@@ -94,20 +113,22 @@ class SchoolScopedUserAdmin(DjangoUserAdmin):
     )
 
     def has_module_permission(self, request):
-        return _is_superuser(request.user) or (_has_school_membership(request.user) and request.user.is_staff)
+        return _is_superuser(request.user) or (
+            _request_membership_school_id(request) is not None and request.user.is_staff
+        )
 
     def get_queryset(self, request):
         qs = super().get_queryset(request)
         if _is_superuser(request.user):
             return qs
 
-        school_id = _membership_school_id(request.user)
+        school_id = _request_membership_school_id(request)
         if not school_id:
             return qs.none()
 
         return qs.filter(
             is_superuser=False,
-            school_membership__school_id=school_id,
+            school_memberships__school_id=school_id,
         )
 
     def get_form(self, request, obj=None, **kwargs):
@@ -145,7 +166,10 @@ class SchoolScopedUserAdmin(DjangoUserAdmin):
 
         if _is_superuser(request.user):
             school = form.cleaned_data.get("school") if hasattr(form, "cleaned_data") else None
-            if school:
+            # UserSuperuserForm seeds the field with the current membership's school,
+            # so an unchanged field means the membership already points there.
+            school_changed = not change or "school" in getattr(form, "changed_data", ("school",))
+            if school and school_changed:
                 SchoolAdminMembership.objects.update_or_create(
                     user=obj,
                     defaults={"school": school},
@@ -29,53 +29,71 @@ class Command(BaseCommand):
         now = timezone.now()
         warning_cutoff = now + timedelta(days=3)
 
-        # Find schools with cancellations scheduled within 3 days
-        upcoming_schools = School.objects.filter(
-            is_active=True,
-        ).filter(
-            Q(stripe_cancel_at__isnull=False, stripe_cancel_at__lte=warning_cutoff, stripe_cancel_at__gt=now)
-            | Q(
-                stripe_cancel_at_period_end=True,
-                stripe_current_period_end__isnull=False,
-                stripe_current_period_end__lte=warning_cutoff,
-                stripe_current_period_end__gt=now,
+        # One query for every school whose cancellation date is at or before the
+        # warning cutoff; split into upcoming/overdue in Python below. This is a
+        # read-only report, so plain dicts are enough (no model instances).
+        candidates = list(
+            School.objects.filter(is_active=True)
+            .filter(
+                Q(stripe_cancel_at__isnull=False, stripe_cancel_at__lte=warning_cutoff)
+                | Q(
+                    stripe_cancel_at_period_end=True,
+                    stripe_current_period_end__isnull=False,
+                    stripe_current_period_end__lte=warning_cutoff,
+                )
             )
-        ).select_related()
-
-        # Find schools with overdue cancellations (still active but should be locked)
-        overdue_schools = School.objects.filter(
-            is_active=True,
-        ).filter(
-            Q(stripe_cancel_at__isnull=False, stripe_cancel_at__lte=now)
-            | Q(
-                stripe_cancel_at_period_end=True,
-                stripe_current_period_end__isnull=False,
-                stripe_current_period_end__lte=now,
+            .values(
+                "slug",
+                "display_name",
+                "stripe_cancel_at",
+                "stripe_cancel_at_period_end",
+                "stripe_current_period_end",
             )
-        ).select_related()
+        )
+
+        def _cancel_dates(school):
+            dates = []
+            if school["stripe_cancel_at"] is not None:
+                dates.append(school["stripe_cancel_at"])
+            if school["stripe_cancel_at_period_end"] and school["stripe_current_period_end"] is not None:
+                dates.append(school["stripe_current_period_end"])
+            return dates
+
+        # Upcoming: a cancellation scheduled within 3 days.
+        # Overdue: a cancellation already passed (still active but should be locked).
+        # Each date is checked against its own window and the matching date is the one
+        # reported, so a past cancel_at never shows up as "will cancel on".
+        upcoming_schools = []
+        overdue_schools = []
+        for school in candidates:
+            dates = _cancel_dates(school)
+            upcoming = [d for d in dates if now < d <= warning_cutoff]
+            overdue = [d for d in dates if d <= now]
+            if upcoming:
+                upcoming_schools.append((school, min(upcoming)))
+            if overdue:
+                overdue_schools.append((school, max(overdue)))
 
         # Log upcoming cancellations as WARNING
-        for school in upcoming_schools:
-            end_date = school.stripe_cancel_at or school.stripe_current_period_end
+        for school, end_date in upcoming_schools:
             logger.warning(
                 "Billing: school '%s' (slug=%s) subscription will cancel on %s",
-                school.display_name or school.slug,
-                school.slug,
+                school["display_name"] or school["slug"],
+                school["slug"],
                 end_date.strftime("%Y-%m-%d %H:%M:%S %Z"),
             )
 
         # Log overdue cancellations as ERROR
-        for school in overdue_schools:
-            end_date = school.stripe_cancel_at or school.stripe_current_period_end
+        for school, end_date in overdue_schools:
             logger.error(
                 "Billing: school '%s' (slug=%s) subscription ENDED on %s but is_active=True (manual deactivation needed)",
-                school.display_name or school.slug,
-                school.slug,
+                school["display_name"] or school["slug"],
+                school["slug"],
                 end_date.strftime("%Y-%m-%d %H:%M:%S %Z"),
             )
 
         self.stdout.write(
             self.style.SUCCESS(
-                f"Checked billing cancellations: {upcoming_schools.count()} upcoming, {overdue_schools.count()} overdue"
+                f"Checked billing cancellations: {len(upcoming_schools)} upcoming, {len(overdue_schools)} overdue"
             )
         )
@@ -1,6 +1,7 @@
 import os
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
 
 User = get_user_model()
 
@@ -16,10 +17,17 @@ class Command(BaseCommand):
             self.stdout.write("DJANGO_SUPERUSER_USERNAME/PASSWORD not set; skipping.")
             return
 
+        # Cheap existence check first, so the password is only hashed on creation.
         if User.objects.filter(username=username).exists():
             self.stdout.write("Superuser already exists; skipping.")
             return
 
-        User.objects.create_superuser(username=username, email=email, password=password)
+        try:
+            with transaction.atomic():
+                User.objects.create_superuser(username=username, email=email, password=password)
+        except IntegrityError:
+            # A concurrent deploy created it between the check and the insert.
+            self.stdout.write("Superuser already exists; skipping.")
+            return
+
         self.stdout.write("Superuser created.")
-        
\ No newline at end of file
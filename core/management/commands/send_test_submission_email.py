@@ -24,6 +24,8 @@ class Command(BaseCommand):
         submission_id = opts["submission_id"]
         application_id = (opts.get("application_id") or opts.get("public_id") or "").strip() or generate_public_id()
 
+        # Served from config_loader's process cache (keyed on file mtime/size),
+        # so repeated invocations in one process do not re-parse the YAML.
         cfg_obj = load_school_config(school_slug)
         if not cfg_obj:
             raise CommandError(f"School config not found for slug={school_slug}")
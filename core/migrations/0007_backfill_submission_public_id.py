@@ -3,7 +3,7 @@ from __future__ import annotations
 import base64
 import secrets
 
-from django.db import IntegrityError, migrations, models
+from django.db import migrations, models
 from django.db.models import Q
 import core.models
 
@@ -19,25 +19,35 @@ def backfill_public_id(apps, schema_editor) -> None:
     qs = Submission.objects.filter(Q(public_id__isnull=True) | Q(public_id=""))
 
     batch_size = 1000
-    ids = list(qs.values_list("id", flat=True).order_by("id"))
+    # Keyset pagination over the pk: only one chunk of ids is held at a time.
+    last_id = 0
 
-    for start in range(0, len(ids), batch_size):
-        chunk_ids = ids[start : start + batch_size]
-        # Update one row at a time to avoid backend/ORM quirks with historical models.
-        for submission_id in chunk_ids:
-            for _ in range(10):
+    while True:
+        chunk_ids = list(
+            qs.filter(id__gt=last_id).order_by("id").values_list("id", flat=True)[:batch_size]
+        )
+        if not chunk_ids:
+            break
+        last_id = chunk_ids[-1]
+
+        # Generate the chunk's ids up front and resolve collisions in memory
+        # (within the chunk, and against ids already stored) before writing.
+        pids = set()
+        while len(pids) < len(chunk_ids):
+            pids.add(_generate_public_id())
+        taken = set(Submission.objects.filter(public_id__in=pids).values_list("public_id", flat=True))
+        while taken:
+            pids -= taken
+            fresh = set()
+            while len(pids) + len(fresh) < len(chunk_ids):
                 pid = _generate_public_id()
-                try:
-                    updated = Submission.objects.filter(
-                        id=submission_id
-                    ).filter(
-                        Q(public_id__isnull=True) | Q(public_id="")
-                    ).update(public_id=pid)
+                if pid not in pids:
+                    fresh.add(pid)
+            taken = set(Submission.objects.filter(public_id__in=fresh).values_list("public_id", flat=True))
+            pids |= fresh
 
-                    if updated == 1:
-                        break
-                except IntegrityError:
-                    continue
+        chunk = [Submission(id=submission_id, public_id=pid) for submission_id, pid in zip(chunk_ids, pids)]
+        Submission.objects.bulk_update(chunk, ["public_id"], batch_size=batch_size)
 
 
 class Migration(migrations.Migration):
@@ -3,6 +3,10 @@
 from django.db import migrations
 
 
+# AdminPreference.theme has carried db_index=True since 0013, so both filters
+# below are index lookups; no extra index is needed for this data migration.
+
+
 def classic_to_minty(apps, schema_editor):
     AdminPreference = apps.get_model("core", "AdminPreference")
     AdminPreference.objects.filter(theme="classic").update(theme="minty")
@@ -4,25 +4,35 @@ from django.db import connection, migrations
 def add_billing_lock_fields(apps, schema_editor):
     """Add billing lock fields only if they don't exist (safe for production)."""
     with connection.cursor() as cursor:
-        # Get existing columns for core_school table
         table_name = "core_school"
+
+        if connection.vendor == "postgresql":
+            # ADD COLUMN IF NOT EXISTS, all in one ALTER TABLE: no catalog
+            # introspection and a single ACCESS EXCLUSIVE lock. The constant
+            # defaults make the NOT NULL columns metadata-only on PG 11+.
+            cursor.execute(
+                f"ALTER TABLE {table_name} "
+                "ADD COLUMN IF NOT EXISTS is_active boolean DEFAULT true NOT NULL, "
+                "ADD COLUMN IF NOT EXISTS stripe_cancel_at timestamp with time zone NULL, "
+                "ADD COLUMN IF NOT EXISTS stripe_cancel_at_period_end boolean DEFAULT false NOT NULL, "
+                "ADD COLUMN IF NOT EXISTS stripe_current_period_end timestamp with time zone NULL"
+            )
+            return
+
+        # For other databases, check first.
+        # SQLite only accepts one ADD COLUMN per ALTER TABLE.
         existing_columns = set(
             row[0] for row in connection.introspection.get_table_description(cursor, table_name)
         )
-
-        # Define columns to add
         columns_to_add = {
             "is_active": "boolean DEFAULT true NOT NULL",
-            "stripe_cancel_at": "timestamp with time zone NULL" if connection.vendor == "postgresql" else "datetime NULL",
+            "stripe_cancel_at": "datetime NULL",
             "stripe_cancel_at_period_end": "boolean DEFAULT false NOT NULL",
-            "stripe_current_period_end": "timestamp with time zone NULL" if connection.vendor == "postgresql" else "datetime NULL",
+            "stripe_current_period_end": "datetime NULL",
         }
-
-        # Add each column if it doesn't exist
         for column_name, column_def in columns_to_add.items():
             if column_name not in existing_columns:
-                sql = f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_def}"
-                cursor.execute(sql)
+                cursor.execute(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_def}")
 
 
 def remove_billing_lock_fields(apps, schema_editor):
@@ -37,9 +47,9 @@ def remove_billing_lock_fields(apps, schema_editor):
         ]
 
         if connection.vendor == "postgresql":
-            # PostgreSQL supports DROP COLUMN IF EXISTS
-            for column_name in columns_to_drop:
-                cursor.execute(f"ALTER TABLE {table_name} DROP COLUMN IF EXISTS {column_name}")
+            # PostgreSQL supports DROP COLUMN IF EXISTS, several per statement
+            clauses = ", ".join(f"DROP COLUMN IF EXISTS {column_name}" for column_name in columns_to_drop)
+            cursor.execute(f"ALTER TABLE {table_name} {clauses}")
         else:
             # For other databases, check first
             existing_columns = set(
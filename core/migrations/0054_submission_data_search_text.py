@@ -0,0 +1,55 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.db import migrations, models
+
+
+def backfill_data_search_text(apps, schema_editor):
+    """Populate data_search_text for existing submissions (mirrors Submission._compute_data_search_text)."""
+    Submission = apps.get_model("core", "Submission")
+
+    batch = []
+    for sub in Submission.objects.only("id", "data").iterator(chunk_size=500):
+        parts = []
+        for v in (sub.data or {}).values():
+            if isinstance(v, str):
+                parts.append(v)
+            elif isinstance(v, list):
+                parts.extend(item for item in v if isinstance(item, str))
+        sub.data_search_text = "\n".join(parts).lower()
+        batch.append(sub)
+        if len(batch) >= 500:
+            Submission.objects.bulk_update(batch, ["data_search_text"])
+            batch = []
+    if batch:
+        Submission.objects.bulk_update(batch, ["data_search_text"])
+
+
+class Migration(migrations.Migration):
+    """
+    Write-time search column for Submission.data, with a pg_trgm GIN index.
+
+    An index over data::text would also match keys and JSON syntax (searching
+    "name" hit every row). data_search_text holds only the string values,
+    lower-cased, so the admin search can use the trigram index (pg_trgm is
+    enabled in 0052).
+    """
+
+    dependencies = [
+        ("core", "0053_draft_unique_active_per_lead"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="submission",
+            name="data_search_text",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="submission",
+            index=GinIndex(
+                fields=["data_search_text"],
+                name="submission_data_srch_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.RunPython(backfill_data_search_text, migrations.RunPython.noop),
+    ]
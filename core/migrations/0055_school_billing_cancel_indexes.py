@@ -0,0 +1,34 @@
+from django.db import migrations, models
+from django.db.models import Q
+
+
+class Migration(migrations.Migration):
+    """
+    Partial indexes for the billing_cancel_reminders scan.
+
+    Each matches one branch of the command's OR: active schools with a
+    stripe_cancel_at, and active schools cancelling at period end.
+    """
+
+    dependencies = [
+        ("core", "0054_submission_data_search_text"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="school",
+            index=models.Index(
+                condition=Q(is_active=True, stripe_cancel_at__isnull=False),
+                fields=["stripe_cancel_at"],
+                name="school_active_cancel_at_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="school",
+            index=models.Index(
+                condition=Q(is_active=True, stripe_cancel_at_period_end=True),
+                fields=["stripe_current_period_end"],
+                name="school_active_period_end_idx",
+            ),
+        ),
+    ]
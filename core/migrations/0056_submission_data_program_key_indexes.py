@@ -0,0 +1,41 @@
+from django.db import migrations, models
+from django.db.models.fields.json import KeyTransform
+
+
+class Migration(migrations.Migration):
+    """
+    Expression indexes on (school, data->'<key>') for the program keys.
+
+    capacity.count_active_submissions() filters submissions of one school by
+    data__<program key> equality; these let that count use an index instead of
+    scanning the school's rows.
+    """
+
+    dependencies = [
+        ("core", "0055_school_billing_cancel_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(models.F("school"), KeyTransform("class_name", "data"), name="sub_data_class_name_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(models.F("school"), KeyTransform("dance_style", "data"), name="sub_data_dance_style_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(models.F("school"), KeyTransform("interested_in", "data"), name="sub_data_interested_in_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(models.F("school"), KeyTransform("program", "data"), name="sub_data_program_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(
+                models.F("school"), KeyTransform("program_interest", "data"), name="sub_data_program_interest_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Give the main JSON columns a database-level '{}' default.
+
+    default=dict only applies to ORM inserts; db_default also covers raw SQL
+    and bulk loads that leave the column out.
+    """
+
+    dependencies = [
+        ("core", "0057_submission_school_status_created_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="school",
+            name="feature_flags",
+            field=models.JSONField(blank=True, db_default={}, default=dict),
+        ),
+        migrations.AlterField(
+            model_name="submission",
+            name="data",
+            field=models.JSONField(db_default={}, default=dict),
+        ),
+        migrations.AlterField(
+            model_name="adminauditlog",
+            name="changes",
+            field=models.JSONField(blank=True, db_default={}, default=dict),
+        ),
+        migrations.AlterField(
+            model_name="adminauditlog",
+            name="extra",
+            field=models.JSONField(blank=True, db_default={}, default=dict),
+        ),
+    ]
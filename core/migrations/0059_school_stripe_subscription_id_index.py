@@ -0,0 +1,25 @@
+from django.db import migrations, models
+from django.db.models import Q
+
+
+class Migration(migrations.Migration):
+    """
+    Partial index for the Stripe subscription webhooks' school lookup.
+
+    Schools without a subscription (the empty string) are left out.
+    """
+
+    dependencies = [
+        ("core", "0058_jsonfield_db_defaults"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="school",
+            index=models.Index(
+                condition=~Q(stripe_subscription_id=""),
+                fields=["stripe_subscription_id"],
+                name="school_stripe_sub_id_idx",
+            ),
+        ),
+    ]
@@ -1,14 +1,15 @@
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import timedelta, datetime, time
 from math import ceil as _ceil
 from django.contrib.postgres.indexes import GinIndex
 from django.db import models, transaction
 from django.db.models import Max, Q
+from django.db.models.fields.json import KeyTransform
 from django.utils import timezone
 import os
 import re
 import uuid
-import base64
 import secrets
 from django.contrib.auth.models import User
 from core.services.form_utils import resolve_label
@@ -29,18 +30,31 @@ def generate_submission_status_token() -> str:
     return secrets.token_urlsafe(32)
 
 
-@dataclass
+@dataclass(slots=True)
 class SchoolFeatures:
     school: "School"
+    _cached_flags: Mapping[str, bool] | None = field(default=None, init=False, repr=False, compare=False)
+    _cached_plan: str | None = field(default=None, init=False, repr=False, compare=False)
+    _cached_overrides: object = field(default=None, init=False, repr=False, compare=False)
 
-    def _flags(self) -> dict[str, bool]:
+    def _flags(self) -> Mapping[str, bool]:
         # Cache per-instance to avoid recomputing on every property access.
         # Effective because School.features caches the SchoolFeatures instance.
-        cached = getattr(self, "_cached_flags", None)
-        if cached is not None:
+        # Read-only: without overrides this is the shared per-plan defaults table.
+        # Keyed on the plan and the feature_flags object so reassigning either on the
+        # school (billing webhooks, admin saves) is picked up without refresh_from_db.
+        school = self.school
+        cached = self._cached_flags
+        if (
+            cached is not None
+            and self._cached_plan == school.plan
+            and self._cached_overrides is school.feature_flags
+        ):
             return cached
-        flags = ff.merge_flags(plan=self.school.plan, overrides=self.school.feature_flags)
+        flags = ff.resolve_flags(plan=school.plan, overrides=school.feature_flags)
         self._cached_flags = flags
+        self._cached_plan = school.plan
+        self._cached_overrides = school.feature_flags
         return flags
 
     # All defaults below are False (deny by default).  _flags() always
@@ -128,7 +142,7 @@ class School(models.Model):
         blank=True,
         db_index=True,
     )
-    feature_flags = models.JSONField(default=dict, blank=True)
+    feature_flags = models.JSONField(default=dict, db_default={}, blank=True)
 
     # Optional branding fields (can be empty; Phase 5 default applies)
     logo_url = models.CharField(max_length=500, blank=True, default="")
@@ -247,6 +261,28 @@ class School(models.Model):
     class Meta:
         verbose_name = "School"
         verbose_name_plural = "Schools"
+        indexes = [
+            # Partial indexes matching billing_cancel_reminders' two predicates:
+            # active schools with a scheduled cancel date, and active schools
+            # cancelling at period end.
+            models.Index(
+                fields=["stripe_cancel_at"],
+                name="school_active_cancel_at_idx",
+                condition=Q(is_active=True, stripe_cancel_at__isnull=False),
+            ),
+            models.Index(
+                fields=["stripe_current_period_end"],
+                name="school_active_period_end_idx",
+                condition=Q(is_active=True, stripe_cancel_at_period_end=True),
+            ),
+            # Stripe subscription webhooks look schools up by subscription id; most
+            # schools have none, so only index the ones that do.
+            models.Index(
+                fields=["stripe_subscription_id"],
+                name="school_stripe_sub_id_idx",
+                condition=~Q(stripe_subscription_id=""),
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.display_name or self.slug
@@ -400,13 +436,40 @@ class SchoolCustomToken(models.Model):
         return f"{self.school.slug} / {self.key}"
 
 
+# Schools whose submissions all belong to one program with no program field in
+# their YAML. program_display_name() falls back to these; admin search mirrors it.
+SCHOOL_FIXED_PROGRAM_NAMES = {
+    "torrance-sister-city-association": "Student Exchange",
+}
+
+
+def student_display_name_from_data(data: dict | None) -> str:
+    """Submission.student_display_name() for a bare data dict (e.g. from values_list)."""
+    data = data or {}
+
+    # Common patterns in our configs
+    first = data.get("student_first_name") or data.get("first_name")
+    last = data.get("student_last_name") or data.get("last_name")
+
+    if first or last:
+        return f"{first or ''} {last or ''}".strip()
+
+    # TSCA
+    applicant = data.get("applicant_name")
+    if applicant:
+        return str(applicant).strip()
+
+    return ""
+
+
 def generate_public_id() -> str:
     """Short, URL-safe identifier for sharing with school admins.
 
     10 random bytes -> 14 chars base64url (no padding). ~80 bits entropy.
     """
 
-    return base64.urlsafe_b64encode(secrets.token_bytes(10)).decode("ascii").rstrip("=")
+    # token_urlsafe is exactly base64url(token_bytes(n)) with padding stripped.
+    return secrets.token_urlsafe(10)
 
 
 
@@ -432,7 +495,9 @@ class Submission(models.Model):
     form_key = models.CharField(max_length=64, default="default", db_index=True, help_text="Identifies which form was used, in case the school has multiple forms.")
 
     # JSONB on Postgres automatically; Django uses JSONField
-    data = models.JSONField(default=dict)
+    # db_default mirrors the Python default at the column level, so raw SQL
+    # and bulk loads that omit the column still get '{}' (migration 0058).
+    data = models.JSONField(default=dict, db_default={})
 
     created_at = models.DateTimeField(auto_now_add=True)
 
@@ -505,6 +570,10 @@ class Submission(models.Model):
     # Powers DB-level ILIKE search via a pg_trgm GIN index (migration 0052).
     search_text = models.TextField(blank=True, default="")
 
+    # Lower-cased leaf string values of `data` (keys excluded), newline-joined.
+    # Kept in sync by save(); backs the admin's free-text search (migration 0054).
+    data_search_text = models.TextField(blank=True, default="", editable=False)
+
     class Meta:
         unique_together = [("school", "school_submission_number")]
         indexes = [
@@ -515,6 +584,20 @@ class Submission(models.Model):
                 name="submission_search_trgm_idx",
                 opclasses=["gin_trgm_ops"],
             ),
+            # Trigram index over the flattened JSON values (migration 0054).
+            GinIndex(
+                fields=["data_search_text"],
+                name="submission_data_srch_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+            # School-scoped lists filter by status and sort newest first (migration 0057).
+            models.Index(fields=["school", "status", "-created_at"], name="sub_school_status_created_idx"),
+            # (school, data->'<key>') for the program keys capacity counts filter
+            # on with data__<key>=<value> (migration 0056).
+            *[
+                models.Index(models.F("school"), KeyTransform(key, "data"), name=f"sub_data_{key}_idx")
+                for key in ("class_name", "dance_style", "interested_in", "program", "program_interest")
+            ],
         ]
 
     _SEARCH_EMAIL_KEYS = ("contact_email", "guardian_email", "parent_email", "email", "applicant_email")
@@ -564,6 +647,20 @@ class Submission(models.Model):
 
         return " ".join(parts)
 
+    def _compute_data_search_text(self) -> str:
+        """
+        Flatten the JSON payload's string values (including strings inside lists)
+        into one lower-cased blob, so admin search is a single substring test
+        instead of walking every value per row. Keys are not included.
+        """
+        parts: list[str] = []
+        for v in (self.data or {}).values():
+            if isinstance(v, str):
+                parts.append(v)
+            elif isinstance(v, list):
+                parts.extend(item for item in v if isinstance(item, str))
+        return "\n".join(parts).lower()
+
     def save(self, *args, **kwargs):
         # Invariant: a session submission must always reference the session's own program.
         if self.session_id is not None and self.program_id is None:
@@ -582,6 +679,14 @@ class Submission(models.Model):
                     uf.append("search_text")
                 kwargs["update_fields"] = uf
 
+        if update_fields is None or "data" in update_fields:
+            self.data_search_text = self._compute_data_search_text()
+            if update_fields is not None:
+                uf = list(kwargs["update_fields"])
+                if "data_search_text" not in uf:
+                    uf.append("data_search_text")
+                kwargs["update_fields"] = uf
+
         if self.pk is None and self.school_submission_number is None:
             with transaction.atomic():
                 # Lock the school row to serialize concurrent submission creates for
@@ -605,78 +710,126 @@ class Submission(models.Model):
         Best-effort extraction of a student/applicant name from dynamic JSON.
         Works across our current YAMLs and is easy to extend later.
         """
-        data = self.data or {}
-
-        # Common patterns in our configs
-        first = data.get("student_first_name") or data.get("first_name")
-        last = data.get("student_last_name") or data.get("last_name")
-
-        if first or last:
-            return f"{first or ''} {last or ''}".strip()
-
-        # TSCA
-        applicant = data.get("applicant_name")
-        if applicant:
-            return str(applicant).strip()
-
-        return ""
+        return student_display_name_from_data(self.data)
+
+    # program_display_name() rules in priority order: (value key, qualifier key,
+    # strip qualifier). The qualifier, when present, renders as "Value (Qualifier)".
+    # None marks where a school's fixed program name (TSCA) takes over.
+    _PROGRAM_NAME_RULES = (
+        ("class_name", None, False),                # Kimberlas
+        ("dance_style", "skill_level", False),      # Dancemaker
+        None,                                       # TSCA
+        ("interested_in", None, False),             # Enrollment Request Demo / simple single-select YAML
+        ("program_interest", None, False),          # backward-compat older key
+        ("program", "experience_level", True),      # Multi-form demo
+    )
 
     def program_display_name(self, label_map: dict | None = None) -> str:
-        data = self.data or {}
-        label_map = label_map or {}
-
         # If the program FK is set, use it directly — most reliable for DB-backed programs.
         if self.program_id and self.program:
             return self.program.name
 
-        # Kimberlas: class_name
-        if data.get("class_name"):
-            raw = data.get("class_name")
+        data = self.data or {}
+        label_map = label_map or {}
+
+        for rule in self._PROGRAM_NAME_RULES:
+            if rule is None:
+                # A `school_slug` annotation (or select_related("school")) keeps
+                # this from lazy-loading the school per row.
+                school_slug = self.__dict__.get("school_slug") or self.school.slug
+                fixed_name = SCHOOL_FIXED_PROGRAM_NAMES.get(school_slug)
+                if fixed_name:
+                    return fixed_name
+                continue
+
+            key, qualifier_key, strip_qualifier = rule
+            raw = data.get(key)
+            if not raw:
+                continue
             # Try to convert value -> label using YAML option map
-            return resolve_label("class_name", raw, label_map) or str(raw)
-
-        # Dancemaker: dance_style (+ skill_level)
-        if data.get("dance_style") and data.get("skill_level"):
-            dance = data.get("dance_style")
-            level = data.get("skill_level")
-
-            dance_label = resolve_label("dance_style", dance, label_map) or str(dance)
-            level_label = resolve_label("skill_level", level, label_map) or str(level)
-
-            return f"{dance_label} ({level_label})"
-
-        if data.get("dance_style"):
-            raw = data.get("dance_style")
-            return resolve_label("dance_style", raw, label_map) or str(raw)
-
-        # TSCA
-        if self.school.slug == "torrance-sister-city-association":
-            return "Student Exchange"
-        
-        # Enrollment Request Demo (and any other simple “single select program” YAML)
-        if data.get("interested_in"):
-            raw = data.get("interested_in")
-            return resolve_label("interested_in", raw, label_map) or str(raw)
-
-        # Backward-compat if any configs used this older key
-        if data.get("program_interest"):
-            raw = data.get("program_interest")
-            return resolve_label("program_interest", raw, label_map) or str(raw)
-
-        # Multi-form demo (program + optional experience level)
-        if data.get("program"):
-            program_raw = data.get("program")
-            program_label = resolve_label("program", program_raw, label_map) or str(program_raw)
-
-            level_raw = (data.get("experience_level") or "").strip()
-            if level_raw:
-                level_label = resolve_label("experience_level", level_raw, label_map) or str(level_raw)
-                return f"{program_label} ({level_label})"
-
-            return program_label
-        
+            label = resolve_label(key, raw, label_map) or str(raw)
+            if qualifier_key:
+                qualifier = data.get(qualifier_key)
+                if strip_qualifier:
+                    qualifier = (qualifier or "").strip()
+                if qualifier:
+                    qualifier_label = resolve_label(qualifier_key, qualifier, label_map) or str(qualifier)
+                    return f"{label} ({qualifier_label})"
+            return label
+
         return ""
 
+    # data keys program_display_name() reads; with the school slug they fully
+    # determine its result for rows without a program FK.
+    _PROGRAM_NAME_DATA_KEYS = tuple(
+        k for rule in _PROGRAM_NAME_RULES if rule for k in rule[:2] if k
+    )
+
+    @classmethod
+    def program_display_names(cls, submissions, label_map: dict | None = None) -> dict[int, str]:
+        """
+        program_display_name() for many submissions at once -> {submission.id: name}.
+
+        Rows with identical inputs (same school + program keys) are resolved
+        once, so large exports don't repeat the same label lookups per row.
+        """
+        memo: dict[tuple, str] = {}
+        out: dict[int, str] = {}
+        for s in submissions:
+            if s.program_id:
+                out[s.id] = s.program_display_name(label_map=label_map)
+                continue
+            data = s.data or {}
+            key = (s.__dict__.get("school_slug") or s.school.slug,) + tuple(
+                data.get(k) for k in cls._PROGRAM_NAME_DATA_KEYS
+            )
+            try:
+                name = memo.get(key)
+            except TypeError:  # unhashable value (e.g. a list) — resolve directly
+                out[s.id] = s.program_display_name(label_map=label_map)
+                continue
+            if name is None:
+                name = memo[key] = s.program_display_name(label_map=label_map)
+            out[s.id] = name
+        return out
+
+
+def create_submissions_bulk(school, payloads, *, form_key: str = "default", batch_size: int = 1000) -> list[Submission]:
+    """
+    Insert one Submission per data payload in batched INSERTs instead of a save() per row.
+
+    bulk_create skips Submission.save(), so this fills in what it would have:
+    per-school numbering (school row locked, as in save()), search_text and
+    data_search_text. public_ids are pre-generated and checked against the table
+    in one query per batch; collisions are regenerated before inserting.
+    """
+    rows = [Submission(school=school, form_key=form_key, data=data) for data in payloads]
+    if not rows:
+        return rows
+
+    with transaction.atomic():
+        School.objects.select_for_update().get(pk=school.pk)
+        last = (
+            Submission.objects.filter(school=school)
+            .aggregate(Max("school_submission_number"))["school_submission_number__max"]
+        ) or 0
+
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            ids = {row.public_id for row in batch}
+            taken = set(Submission.objects.filter(public_id__in=ids).values_list("public_id", flat=True))
+            seen: set[str] = set()
+            for row in batch:
+                while row.public_id in taken or row.public_id in seen:
+                    row.public_id = generate_public_id()
+                seen.add(row.public_id)
+
+        for n, row in enumerate(rows, start=last + 1):
+            row.school_submission_number = n
+            row.search_text = row._compute_search_text()
+            row.data_search_text = row._compute_data_search_text()
+        return Submission.objects.bulk_create(rows, batch_size=batch_size)
+
 
 def submission_upload_path(instance, filename: str) -> str:
     """
@@ -687,6 +840,12 @@ def submission_upload_path(instance, filename: str) -> str:
     return f"uploads/{instance.submission.school.slug}/{instance.submission_id}/{uuid.uuid4().hex}__{safe_name}"
 
 
+class SubmissionFileQuerySet(models.QuerySet):
+    def with_context(self):
+        """Join submission + school so __str__ and per-submission fields need no extra queries."""
+        return self.select_related("submission__school")
+
+
 class SubmissionFile(models.Model):
     submission = models.ForeignKey(
         "Submission",
@@ -705,6 +864,8 @@ class SubmissionFile(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = SubmissionFileQuerySet.as_manager()
+
     def __str__(self) -> str:
         return f"{self.submission.school.slug} #{self.submission_id} {self.field_key}"
     
@@ -961,7 +1122,7 @@ class AdminAuditLog(models.Model):
     object_repr = models.TextField(blank=True, default="")
 
     # What changed
-    changes = models.JSONField(default=dict, blank=True)  # {"field": {"from": x, "to": y}}
+    changes = models.JSONField(default=dict, db_default={}, blank=True)  # {"field": {"from": x, "to": y}}
 
     # Request context
     path = models.TextField(blank=True, default="")
@@ -969,7 +1130,7 @@ class AdminAuditLog(models.Model):
     user_agent = models.TextField(blank=True, default="")
 
     # Any extra metadata (counts, filters, etc.)
-    extra = models.JSONField(default=dict, blank=True)
+    extra = models.JSONField(default=dict, db_default={}, blank=True)
 
     _MODEL_LABEL_MAP = {
         "core.school": "School",
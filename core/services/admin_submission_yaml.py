@@ -1,9 +1,11 @@
 # core/services/admin_submission_yaml.py
 from __future__ import annotations
 
-from typing import Any
+import re
+from typing import Any, Callable
 
-from core.admin.common import DYN_PREFIX
+from core.admin.common import _dyn_key
+from core.services.config_loader import get_compiled_form
 
 
 def build_yaml_sections(cfg, existing_data: dict[str, Any] | None, post_data=None, form: dict | None = None, school=None, form_key: str = "default") -> list[dict]:
@@ -23,26 +25,17 @@ def build_yaml_sections(cfg, existing_data: dict[str, Any] | None, post_data=Non
     existing = existing_data or {}
     yaml_sections: list[dict] = []
 
-    for section in (form.get("sections", []) if cfg else []):
+    for section, compiled_fields in (get_compiled_form(cfg, form) if cfg else ()):
         section_title = section.get("title") or "Form"
         fields: list[dict] = []
 
-        for f in section.get("fields", []):
-            ftype = (f.get("type") or "text").strip().lower()
+        for key, ftype, _required, _label, options, _max_mb, _max_bytes, display in compiled_fields:
             if ftype == "file":
                 continue
-
-            key = f.get("key")
-            if not key:
-                continue
-
-            label = f.get("label") or key.replace("_", " ").title()
-            required = bool(f.get("required", False))
-            options = f.get("options") or []
+            name = _dyn_key(key)
 
             # 1. Resolve value from POST or existing data first.
             if post_data is not None:
-                name = f"{DYN_PREFIX}{key}"
                 if ftype == "multiselect":
                     value = post_data.getlist(name)
                 elif ftype == "checkbox":
@@ -101,25 +94,14 @@ def build_yaml_sections(cfg, existing_data: dict[str, Any] | None, post_data=Non
                         display_value = opt.get("label")
                         break
 
+            # Static props come precompiled; only per-submission values are added here.
             fields.append(
                 {
-                    "key": key,
-                    "label": label,
-                    "type": ftype,
-                    "required": required,
+                    **display,
                     "options": options,
                     "option_groups": option_groups,
                     "value": value,
                     "display_value": display_value,
-                    # Display properties passed through for template rendering
-                    "placeholder": f.get("placeholder", ""),
-                    "help_text": f.get("help_text", ""),
-                    "full_width": bool(f.get("full_width", False)),
-                    "ui": f.get("ui", ""),
-                    "text": f.get("text", ""),            # waiver body text
-                    "link_url": f.get("link_url", ""),    # waiver link
-                    "link_text": f.get("link_text", ""),  # waiver link label
-                    "checkbox_label": f.get("checkbox_label", ""),
                     "no_programs_warning": no_programs_warning,
                 }
             )
@@ -153,28 +135,20 @@ def validate_required_fields(
 
     # Keys editable right now; only these can produce blocking errors
     editable_keys: set[str] = {
-        f.get("key")
-        for section in form_cfg.get("sections", [])
-        for f in section.get("fields", [])
-        if f.get("key")
+        cf.key
+        for _section, fields in get_compiled_form(cfg, form_cfg)
+        for cf in fields
     }
 
     # Validate against all required fields in the full YAML config so that
     # required fields from other form steps surface as warnings instead of
     # being silently ignored.
     full_form = getattr(cfg, "form", None) or form_cfg
-    for section in full_form.get("sections", []):
-        for f in section.get("fields", []):
-            ftype = (f.get("type") or "text").strip().lower()
-            if ftype in ("file", "waiver"):
-                continue
-
-            key = f.get("key")
-            if not key or not f.get("required"):
+    for _section, fields in get_compiled_form(cfg, full_form):
+        for key, ftype, required, label, _options, _max_mb, _max_bytes, _display in fields:
+            if ftype in ("file", "waiver") or not required:
                 continue
-
-            label = f.get("label") or key.replace("_", " ").title()
-            name = f"{DYN_PREFIX}{key}"
+            name = _dyn_key(key)
 
             missing = False
             if ftype == "multiselect":
@@ -205,44 +179,51 @@ def apply_post_to_submission_data(cfg, post_data, existing_data: dict, form: dic
         return data
 
     form = form or getattr(cfg, "form", None) or {}
-    for section in form.get("sections", []):
-        for f in section.get("fields", []):
-            ftype = (f.get("type") or "text").strip().lower()
-            if ftype in ("file", "waiver"):
+    for _section, fields in get_compiled_form(cfg, form):
+        for cf in fields:
+            if cf.ftype in ("file", "waiver"):
                 continue
+            handler = _POST_VALUE_HANDLERS.get(cf.ftype, _post_str)
+            data[cf.key] = handler(post_data, _dyn_key(cf.key))
 
-            key = f.get("key")
-            if not key:
-                continue
+    return data
 
-            name = f"{DYN_PREFIX}{key}"
 
-            if ftype == "multiselect":
-                data[key] = post_data.getlist(name)
-                continue
+def _post_multiselect(post_data, name: str):
+    return post_data.getlist(name)
 
-            if ftype == "checkbox":
-                data[key] = name in post_data
-                continue
 
-            raw = post_data.get(name, "")
-            if raw is None:
-                raw = ""
+def _post_checkbox(post_data, name: str):
+    return name in post_data
 
-            if ftype == "number":
-                if raw == "":
-                    data[key] = ""
-                else:
-                    try:
-                        data[key] = float(raw)
-                    except ValueError:
-                        data[key] = raw
-                continue
 
-            # date + everything else: store as string
-            data[key] = raw
+def _post_str(post_data, name: str):
+    # date + everything else: store as string
+    raw = post_data.get(name, "")
+    return "" if raw is None else raw
+
+
+# Decimal/scientific literals float() accepts. Anything else is stored as the
+# raw string without a try/except round-trip (this also keeps "nan"/"inf",
+# which JSON can't represent, out of submission data).
+_NUMBER_RE = re.compile(r"\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\s*")
+
+
+def _post_number(post_data, name: str):
+    raw = _post_str(post_data, name)
+    if raw == "":
+        return ""
+    if isinstance(raw, str) and _NUMBER_RE.fullmatch(raw):
+        return float(raw)
+    return raw
+
+
+_POST_VALUE_HANDLERS: dict[str, Callable[[Any, str], Any]] = {
+    "multiselect": _post_multiselect,
+    "checkbox": _post_checkbox,
+    "number": _post_number,
+}
 
-    return data
 
 def get_submission_workflow_filters(config_raw: dict) -> dict:
     """Returns {key: {"label": str, "statuses": list[str]}} or {} if not configured.
@@ -9,7 +9,8 @@ complete, self-contained config — no partial overrides to debug.
 """
 from __future__ import annotations
 
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 
 # ── Jazzmin UI tweaks baseline ───────────────────────────────────────────
@@ -110,30 +111,41 @@ ADMIN_THEMES: dict[str, dict[str, Any]] = {
 THEME_CHOICES = [(key, cfg["label"]) for key, cfg in ADMIN_THEMES.items()]
 
 
-def get_theme_ui_tweaks(theme_key: str) -> dict[str, Any]:
-    """Return a complete Jazzmin UI tweaks dict for *theme_key*.
+def _merge_ui_tweaks(ui_tweaks: dict[str, Any]) -> dict[str, Any]:
+    tweaks: dict[str, Any] = _JAZZMIN_UI_DEFAULTS.copy()
+    # Copy button_classes so per-theme overrides don't mutate the default
+    tweaks["button_classes"] = _JAZZMIN_UI_DEFAULTS["button_classes"].copy()
+    tweaks.update(ui_tweaks)
+    return tweaks
+
+
+# Themes are static, so merge each one once at import. Read-only views are
+# handed out; callers that need to change a value copy it first.
+_MERGED_UI_TWEAKS: dict[str, Mapping[str, Any]] = {
+    key: MappingProxyType(_merge_ui_tweaks(cfg["ui_tweaks"])) for key, cfg in ADMIN_THEMES.items()
+}
+
+
+def get_theme_ui_tweaks(theme_key: str) -> Mapping[str, Any]:
+    """Return the complete (read-only) Jazzmin UI tweaks mapping for *theme_key*.
 
     Unknown keys fall back to DEFAULT_THEME_KEY so the admin never breaks.
     """
-    cfg = ADMIN_THEMES.get(theme_key or DEFAULT_THEME_KEY)
-    if cfg is None:
-        cfg = ADMIN_THEMES[DEFAULT_THEME_KEY]
+    return _MERGED_UI_TWEAKS.get(theme_key or DEFAULT_THEME_KEY) or _MERGED_UI_TWEAKS[DEFAULT_THEME_KEY]
 
-    tweaks: dict[str, Any] = _JAZZMIN_UI_DEFAULTS.copy()
-    # Deep-copy button_classes so per-theme overrides don't mutate the default
-    tweaks["button_classes"] = _JAZZMIN_UI_DEFAULTS["button_classes"].copy()
-    tweaks.update(cfg["ui_tweaks"])
-    return tweaks
+
+# Static for the life of the process; built once at import.
+_THEMES_API_PAYLOAD: tuple[dict[str, str], ...] = tuple(
+    {
+        "key": key,
+        "label": cfg["label"],
+        "icon": cfg["icon"],
+        "description": cfg["description"],
+    }
+    for key, cfg in ADMIN_THEMES.items()
+)
 
 
 def get_themes_for_api() -> list[dict[str, str]]:
-    """Serialisable list of themes for the JS theme picker."""
-    return [
-        {
-            "key": key,
-            "label": cfg["label"],
-            "icon": cfg["icon"],
-            "description": cfg["description"],
-        }
-        for key, cfg in ADMIN_THEMES.items()
-    ]
+    """Serialisable list of themes for the JS theme picker (entries are shared; don't mutate)."""
+    return list(_THEMES_API_PAYLOAD)
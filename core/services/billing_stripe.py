@@ -8,9 +8,13 @@ Never import stripe directly in views; always go through this module.
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime, timezone
 
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.db.models import Q
 
 logger = logging.getLogger(__name__)
 
@@ -31,17 +35,41 @@ def _get_stripe():
         import stripe
 
         stripe.api_key = secret
+        if stripe.default_http_client is None:
+            # Pin one pooled client for the process so API calls reuse keep-alive
+            # connections instead of a fresh TLS handshake each time.
+            stripe.default_http_client = stripe.RequestsClient()
         return stripe
     except ImportError:
         logger.error("stripe package not installed — pip install stripe")
         return None
 
 
+# Set once is_stripe_configured() succeeds; only True is cached so fixing the keys
+# in dev takes effect without a restart. Reset when Stripe settings change.
+_configured: bool | None = None
+
+
+@receiver(setting_changed)
+def _reset_stripe_configured(*, setting, **kwargs):
+    global _configured
+    if setting.startswith("STRIPE_"):
+        _configured = None
+
+
 def is_stripe_configured() -> bool:
     """Return True if Stripe keys are present and SDK is available."""
-    return _get_stripe() is not None and bool(
-        getattr(settings, "STRIPE_PUBLISHABLE_KEY", "").strip()
-    )
+    global _configured
+    if _configured is not None:
+        return _configured
+    # Cheapest check first: without a publishable key there is no need to
+    # import/configure the SDK (or log its "not set" warning) at all.
+    if not getattr(settings, "STRIPE_PUBLISHABLE_KEY", "").strip():
+        return False
+    if _get_stripe() is None:
+        return False
+    _configured = True
+    return True
 
 
 # ---------------------------------------------------------------------------
@@ -61,6 +89,10 @@ _PRICE_SETTINGS = [
 ]
 
 
+# (setting name, plan) pairs for price_to_plan, built once from the table above.
+_PRICE_SETTING_PLANS = tuple((row[0], row[4]) for row in _PRICE_SETTINGS)
+
+
 def _price(setting_name: str) -> str:
     return getattr(settings, setting_name, "").strip()
 
@@ -87,15 +119,13 @@ def get_pricing_options() -> list[dict]:
 # ---------------------------------------------------------------------------
 def price_to_plan(price_id: str) -> str | None:
     """Map a Stripe Price ID to an internal plan name, or None if unknown."""
-    plan_map = {"starter": ["STRIPE_PRICE_STARTER_MONTHLY", "STRIPE_PRICE_STARTER_ANNUAL"],
-                "pro":     ["STRIPE_PRICE_PRO_MONTHLY",     "STRIPE_PRICE_PRO_ANNUAL"],
-                "growth":  ["STRIPE_PRICE_GROWTH_MONTHLY",  "STRIPE_PRICE_GROWTH_ANNUAL"],
-                "custom":  ["STRIPE_PRICE_CUSTOM_MONTHLY",  "STRIPE_PRICE_CUSTOM_ANNUAL"]}
-    for plan, setting_names in plan_map.items():
-        for sname in setting_names:
-            pid = _price(sname)
-            if pid and pid == price_id:
-                return plan
+    if not price_id:
+        return None
+    # Walk the static (setting, plan) table; only the price IDs themselves are read
+    # lazily so override_settings() keeps working.
+    for setting_name, plan in _PRICE_SETTING_PLANS:
+        if _price(setting_name) == price_id:
+            return plan
     return None
 
 
@@ -188,6 +218,68 @@ def construct_webhook_event(payload: bytes, sig_header: str) -> object | None:
 # ---------------------------------------------------------------------------
 # Webhook handlers — keep idempotent
 # ---------------------------------------------------------------------------
+
+# School columns each webhook handler writes (passed as save(update_fields=...)).
+_CHECKOUT_UPDATE_FIELDS = (
+    "stripe_customer_id",
+    "stripe_subscription_id",
+    "stripe_subscription_status",
+    "plan",
+    "is_active",
+    "stripe_cancel_at",
+    "stripe_cancel_at_period_end",
+    "stripe_current_period_end",
+)
+_SUBSCRIPTION_UPDATED_FIELDS = (
+    "stripe_subscription_status",
+    "plan",
+    "stripe_cancel_at",
+    "stripe_cancel_at_period_end",
+    "stripe_current_period_end",
+    "is_active",
+)
+_SUBSCRIPTION_DELETED_FIELDS = (
+    "stripe_subscription_status",
+    "is_active",
+    "stripe_cancel_at",
+    "stripe_cancel_at_period_end",
+    "stripe_current_period_end",
+)
+
+# subscription id -> (monotonic fetch time, Stripe subscription). Stripe retries and
+# near-simultaneous checkout events for one subscription reuse a single retrieve.
+# subscription.updated / .deleted carry fresher state and evict their entry.
+_SUB_CACHE: dict[str, tuple[float, object]] = {}
+_SUB_CACHE_TTL = 300
+_SUB_CACHE_MAX = 256
+
+
+def _retrieve_subscription_cached(stripe, subscription_id: str, ttl: float = _SUB_CACHE_TTL):
+    """stripe.Subscription.retrieve with a short per-process TTL cache."""
+    now = time.monotonic()
+    entry = _SUB_CACHE.get(subscription_id)
+    if entry is not None and now - entry[0] < ttl:
+        return entry[1]
+
+    sub = stripe.Subscription.retrieve(subscription_id)
+    if sub:
+        if len(_SUB_CACHE) >= _SUB_CACHE_MAX:
+            for key in [k for k, (ts, _) in _SUB_CACHE.items() if now - ts >= ttl] or list(_SUB_CACHE):
+                _SUB_CACHE.pop(key, None)
+        _SUB_CACHE[subscription_id] = (now, sub)
+    return sub
+
+
+def _unix_to_dt(value) -> datetime | None:
+    """Stripe unix timestamp -> aware UTC datetime; None for empty or malformed values."""
+    if not value:
+        return None
+    try:
+        return datetime.fromtimestamp(int(value), tz=timezone.utc)
+    except (TypeError, ValueError, OverflowError, OSError):
+        return None
+
+
 def handle_checkout_completed(session_data: dict) -> None:
     """Handle checkout.session.completed — link Stripe customer + subscription to school."""
     from core.models import School
@@ -231,7 +323,7 @@ def handle_checkout_completed(session_data: dict) -> None:
         try:
             stripe = _get_stripe()
             if stripe:
-                sub = stripe.Subscription.retrieve(subscription_id)
+                sub = _retrieve_subscription_cached(stripe, subscription_id)
                 if sub and sub.get("items", {}).get("data"):
                     price_id = sub["items"]["data"][0].get("price", {}).get("id", "")
                     plan = price_to_plan(price_id)
@@ -247,18 +339,7 @@ def handle_checkout_completed(session_data: dict) -> None:
     school.stripe_cancel_at_period_end = False
     school.stripe_current_period_end = None
 
-    school.save(
-        update_fields=[
-            "stripe_customer_id",
-            "stripe_subscription_id",
-            "stripe_subscription_status",
-            "plan",
-            "is_active",
-            "stripe_cancel_at",
-            "stripe_cancel_at_period_end",
-            "stripe_current_period_end",
-        ]
-    )
+    school.save(update_fields=_CHECKOUT_UPDATE_FIELDS)
     logger.info(
         "Stripe webhook checkout.session.completed: school=%s customer=%s subscription=%s plan=%s is_active=True",
         school.slug,
@@ -274,13 +355,19 @@ def handle_subscription_updated(subscription_data: dict) -> None:
 
     sub_id = subscription_data.get("id", "")
     status = subscription_data.get("status", "")
-
-    school = School.objects.filter(stripe_subscription_id=sub_id).first()
-    # Fallback: sometimes early events include metadata.school_slug
-    if not school:
-        meta_slug = (subscription_data.get("metadata") or {}).get("school_slug")
-        if meta_slug:
-            school = School.objects.filter(slug=meta_slug).first()
+    _SUB_CACHE.pop(sub_id, None)
+
+    # Fallback: sometimes early events include metadata.school_slug. Both lookups go
+    # in one query; a subscription-id match still wins over the metadata slug.
+    lookup = Q(stripe_subscription_id=sub_id)
+    meta_slug = (subscription_data.get("metadata") or {}).get("school_slug")
+    if meta_slug:
+        lookup |= Q(slug=meta_slug)
+    candidates = list(School.objects.filter(lookup).order_by("pk")[:2])
+    school = next(
+        (s for s in candidates if s.stripe_subscription_id == sub_id),
+        candidates[0] if candidates else None,
+    )
 
     if not school:
         logger.warning(
@@ -310,17 +397,9 @@ def handle_subscription_updated(subscription_data: dict) -> None:
     except Exception:
         current_period_end = subscription_data.get("current_period_end")
 
-    def _to_dt(value):
-        if not value:
-            return None
-        try:
-            return datetime.fromtimestamp(int(value), tz=timezone.utc)
-        except Exception:
-            return None
-
-    school.stripe_cancel_at = _to_dt(cancel_at)
+    school.stripe_cancel_at = _unix_to_dt(cancel_at)
     school.stripe_cancel_at_period_end = bool(cancel_at_period_end)
-    school.stripe_current_period_end = _to_dt(current_period_end)
+    school.stripe_current_period_end = _unix_to_dt(current_period_end)
 
     # Sync is_active based on subscription status
     if status in ("active", "trialing"):
@@ -331,9 +410,7 @@ def handle_subscription_updated(subscription_data: dict) -> None:
         school.is_active = False
     # past_due / unpaid: do not change is_active — grace period, school retains access
 
-    school.save(update_fields=[
-        "stripe_subscription_status", "plan", "stripe_cancel_at", "stripe_cancel_at_period_end", "stripe_current_period_end", "is_active"
-    ])
+    school.save(update_fields=_SUBSCRIPTION_UPDATED_FIELDS)
     logger.info(
         "Stripe webhook customer.subscription.updated: school=%s status=%s plan=%s is_active=%s",
         school.slug,
@@ -348,6 +425,7 @@ def handle_subscription_deleted(subscription_data: dict) -> None:
     from core.models import School
 
     sub_id = subscription_data.get("id", "")
+    _SUB_CACHE.pop(sub_id, None)
 
     school = School.objects.filter(stripe_subscription_id=sub_id).first()
     if not school:
@@ -363,9 +441,7 @@ def handle_subscription_deleted(subscription_data: dict) -> None:
     school.stripe_cancel_at = None
     school.stripe_cancel_at_period_end = False
     school.stripe_current_period_end = None
-    school.save(update_fields=[
-        "stripe_subscription_status", "is_active", "stripe_cancel_at", "stripe_cancel_at_period_end", "stripe_current_period_end"
-    ])
+    school.save(update_fields=_SUBSCRIPTION_DELETED_FIELDS)
     logger.info(
         "Stripe webhook customer.subscription.deleted: school=%s plan=%s locked (is_active=False)",
         school.slug,
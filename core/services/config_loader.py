@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+import re
+import threading
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
 
 import yaml
 from django.conf import settings
 
+from .form_utils import CompiledForm, build_option_label_map, compile_form
+
+try:  # libyaml-backed loader when PyYAML was built with it; same safe subset of YAML.
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pure-Python fallback
+    from yaml import SafeLoader as _SafeLoader
+
 DEFAULT_THEME = {
     # existing
     "primary_color": "#111827",  # slate-ish
@@ -30,6 +40,46 @@ DEFAULT_BRANDING = {
 }
 
 
+# Public-page branding defaults (merge_branding); stricter about empty colours than
+# SchoolConfig.branding, which only fills in missing keys.
+PUBLIC_DEFAULT_BRANDING = {
+    "logo_url": None,
+    "theme": {
+        "primary_color": "#111827",
+        "accent_color": "#ea580c",
+        "background": "#f7f7fb",
+        "card": "#ffffff",
+        "text": "#111827",
+        "muted": "#6b7280",
+        "border": "#e5e7eb",
+        "radius": "16px",
+    },
+    "custom_css": None,
+    "custom_js": None,
+}
+
+
+def merge_branding(branding_in: dict | None) -> dict:
+    branding_in = branding_in or {}
+
+    merged = {
+        "logo_url": branding_in.get("logo_url", PUBLIC_DEFAULT_BRANDING["logo_url"]),
+        "custom_css": branding_in.get("custom_css", PUBLIC_DEFAULT_BRANDING["custom_css"]),
+        "custom_js": branding_in.get("custom_js", PUBLIC_DEFAULT_BRANDING["custom_js"]),
+        "theme": PUBLIC_DEFAULT_BRANDING["theme"].copy(),
+    }
+
+    theme_in = branding_in.get("theme") or {}
+    merged["theme"].update(theme_in)
+
+    if not merged["theme"].get("accent_color"):
+        merged["theme"]["accent_color"] = PUBLIC_DEFAULT_BRANDING["theme"]["accent_color"]
+    if not merged["theme"].get("primary_color"):
+        merged["theme"]["primary_color"] = merged["theme"]["text"] or PUBLIC_DEFAULT_BRANDING["theme"]["text"]
+
+    return merged
+
+
 def prettify_school_name_from_slug(slug: str) -> str:
     # "kimberlas-classical-ballet" -> "Kimberlas Classical Ballet"
     return " ".join([p.capitalize() for p in slug.replace("_", "-").split("-") if p])
@@ -62,11 +112,18 @@ def get_forms(config) -> dict:
     return {}
 
 
+_T = TypeVar("_T")
+
+
 @dataclass(frozen=True)
 class SchoolConfig:
+    # Derived views of raw are cached_property: it writes straight into the instance
+    # __dict__, so it works on this frozen dataclass, and since load_school_config
+    # shares one instance per file version they are computed once per YAML edit.
+    # Treat the returned dicts as read-only.
     raw: Dict[str, Any]
 
-    @property
+    @cached_property
     def schema_version(self) -> str:
         return str(self.raw.get("schema_version", "1.0"))
 
@@ -74,7 +131,7 @@ class SchoolConfig:
     def school_slug(self) -> str:
         return self.raw["school"]["slug"]
 
-    @property
+    @cached_property
     def display_name(self) -> str:
         display = self.raw.get("school", {}).get("display_name", "")
         if display:
@@ -89,7 +146,7 @@ class SchoolConfig:
         """
         return self.raw.get("override_slots") or {}
 
-    @property
+    @cached_property
     def branding(self) -> Dict[str, Any]:
         """
         Returns a normalized branding dict used by templates.
@@ -120,7 +177,7 @@ class SchoolConfig:
             },
         }
 
-    @property
+    @cached_property
     def form(self) -> dict:
         raw = self.raw or {}
 
@@ -140,6 +197,49 @@ class SchoolConfig:
 
         return {}
 
+    @cached_property
+    def option_label_map(self) -> Dict[str, Dict[str, str]]:
+        """build_option_label_map(form), built once per config version; read-only."""
+        return build_option_label_map(self.form or {})
+
+    @cached_property
+    def merged_branding(self) -> Dict[str, Any]:
+        """merge_branding(branding) for the public pages; read-only (copy before editing)."""
+        return merge_branding(self.branding)
+
+    @cached_property
+    def _memo(self) -> Dict[Any, Any]:
+        return {}
+
+    def memoized(self, key: Any, build: Callable[[], _T]) -> _T:
+        """
+        build(), computed once per config version for `key`.
+
+        For derived data that needs an argument (form key, form) and so can't be a
+        cached_property. The result is shared: treat it as read-only.
+        """
+        memo = self._memo
+        try:
+            return memo[key]
+        except KeyError:
+            return memo.setdefault(key, build())
+
+    @cached_property
+    def _own_form_ids(self) -> frozenset:
+        forms = [self.form] + [meta.get("form") for meta in get_forms(self).values() if isinstance(meta, dict)]
+        return frozenset(id(form) for form in forms if isinstance(form, dict))
+
+    def compiled_form(self, form: Dict[str, Any]) -> CompiledForm:
+        """
+        compile_form(form), memoized when `form` is one of this config's own form dicts.
+
+        Per-request copies (deep-copied or injected forms) are compiled without caching,
+        so they never pin memory or push out the shared entries.
+        """
+        if id(form) not in self._own_form_ids:
+            return compile_form(form)
+        return self.memoized(("compiled_form", id(form)), lambda: compile_form(form))
+
 
 PROGRAM_FIELD_KEYS = {"interested_in", "program", "program_interest", "dance_style"}
 
@@ -190,6 +290,33 @@ def get_program_options(config: "SchoolConfig") -> list[dict]:
     return []
 
 
+def config_memo(config: Any, key: Any, build: Callable[[], _T]) -> _T:
+    """config.memoized(key, build) for a SchoolConfig; plain build() for config-like objects."""
+    memoized = getattr(config, "memoized", None)
+    if memoized is None:
+        return build()
+    return memoized(key, build)
+
+
+def get_compiled_form(config: Any, form: Dict[str, Any]) -> CompiledForm:
+    """compile_form(form), cached on the config when it owns the form dict."""
+    compiled = getattr(config, "compiled_form", None)
+    if compiled is None:
+        return compile_form(form)
+    return compiled(form)
+
+
+def get_option_label_map(config: Optional["SchoolConfig"]) -> Dict[str, Dict[str, str]]:
+    """SchoolConfig.option_label_map, or {} when there is no config."""
+    if not config:
+        return {}
+    label_map = getattr(config, "option_label_map", None)
+    if label_map is None:
+        # Config-like objects (e.g. test doubles) without the cached property.
+        return build_option_label_map(getattr(config, "form", None) or {})
+    return label_map
+
+
 def get_lead_form_config(config_raw: dict, form_key: str | None = None) -> dict | None:
     """
     Returns merged lead form config with safe defaults.
@@ -215,7 +342,9 @@ def get_lead_form_config(config_raw: dict, form_key: str | None = None) -> dict
         leads = raw.get("leads") or {}
 
     raw_fields = leads.get("fields") or []
-    fields = [f for f in raw_fields if isinstance(f, dict) and f.get("key") and f.get("label")]
+    # Copy each field: callers inject DB program options into these dicts, and the
+    # underlying config is shared via load_school_config's cache.
+    fields = [dict(f) for f in raw_fields if isinstance(f, dict) and f.get("key") and f.get("label")]
     return {
         "form_title": (leads.get("form_title") or "").strip() or "Request Information",
         "form_description": (leads.get("form_description") or "").strip() or "Tell us about your interest and we'll follow up with next steps.",
@@ -311,21 +440,50 @@ def get_application_fee_config(config_raw: dict, form_key: str, form_data: dict
     }
 
 
+# path -> ((mtime_ns, size), SchoolConfig). One entry per YAML file: an edited
+# file replaces its entry instead of leaving stale versions behind.
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], SchoolConfig]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+def _parse_school_config(path: str) -> SchoolConfig:
+    # Bytes straight to the loader: libyaml decodes UTF-8 itself.
+    raw = yaml.load(Path(path).read_bytes(), Loader=_SafeLoader) or {}
+    return SchoolConfig(raw=raw)
+
+
 def load_school_config(school_slug: str) -> Optional[SchoolConfig]:
     """
     Loads configs/schools/<school_slug>.yaml.
     Returns None if file doesn't exist.
+
+    Parsed configs are cached per process and re-read when the file changes,
+    so the returned SchoolConfig is shared — callers must not mutate it.
+    A cache hit costs a single stat().
     """
     base_dir = Path(settings.BASE_DIR)
     path = base_dir / "configs" / "schools" / f"{school_slug}.yaml"
 
-    if not path.exists():
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         return None
 
-    with path.open("r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f) or {}
+    # Keyed by full path (not slug) so a changed BASE_DIR never serves another tree's file;
+    # size is part of the version because mtime can be coarse on some filesystems.
+    key = str(path)
+    version = (st.st_mtime_ns, st.st_size)
+    entry = _CONFIG_CACHE.get(key)
+    if entry is not None and entry[0] == version:
+        return entry[1]
 
-    return SchoolConfig(raw=raw)
+    cfg = _parse_school_config(key)
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE[key] = (version, cfg)
+    return cfg
+
+
+_SLOT_RE = re.compile(r"\{\{slot:([^{}]+)\}\}")
 
 
 def _substitute_slots(obj: Any, slots: Dict[str, str]) -> Any:
@@ -336,9 +494,10 @@ def _substitute_slots(obj: Any, slots: Dict[str, str]) -> Any:
     The input is never mutated — new dicts/lists are returned.
     """
     if isinstance(obj, str):
-        for key, val in slots.items():
-            obj = obj.replace(f"{{{{slot:{key}}}}}", val)
-        return obj
+        if "{{slot:" not in obj:
+            return obj
+        # One pass per string; substituted values are never re-scanned for slots.
+        return _SLOT_RE.sub(lambda m: slots.get(m.group(1), m.group(0)), obj)
     if isinstance(obj, dict):
         return {k: _substitute_slots(v, slots) for k, v in obj.items()}
     if isinstance(obj, list):
@@ -1,7 +1,8 @@
 # core/services/feature_flags.py
 from __future__ import annotations
 
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 
 # ── Plan constants (single source of truth) ──────────────────────────────
@@ -61,21 +62,36 @@ _FEATURE_MIN_PLAN: dict[str, str] = {
 ALL_FLAGS = list(_FEATURE_MIN_PLAN.keys())
 
 
+def _compute_default_flags(rank: int) -> dict[str, bool]:
+    return {
+        flag: rank >= PLAN_RANK.get(min_plan, 0)
+        for flag, min_plan in _FEATURE_MIN_PLAN.items()
+    }
+
+
+# Plan defaults never change at runtime, so build them once at import.
+_DEFAULT_FLAGS_BY_PLAN: dict[str, dict[str, bool]] = {
+    plan: _compute_default_flags(rank) for plan, rank in PLAN_RANK.items()
+}
+_DEFAULT_FLAGS_BY_PLAN[PLAN_TRIAL] = {flag: True for flag in _FEATURE_MIN_PLAN}
+_UNKNOWN_PLAN_FLAGS = _compute_default_flags(PLAN_RANK[PLAN_TRIAL])
+
+# Read-only views of the tables above, shared by every school on a plan.
+_READONLY_FLAGS_BY_PLAN: dict[str, Mapping[str, bool]] = {
+    plan: MappingProxyType(flags) for plan, flags in _DEFAULT_FLAGS_BY_PLAN.items()
+}
+_READONLY_UNKNOWN_PLAN_FLAGS: Mapping[str, bool] = MappingProxyType(_UNKNOWN_PLAN_FLAGS)
+
+
 def default_flags_for_plan(plan: str) -> dict[str, bool]:
-    """Compute default flag values for a plan based on cumulative tier ranks.
+    """Default flag values for a plan based on cumulative tier ranks.
 
     Trial is full-featured — every flag is True — to support a marketing
     trial where schools experience the full product before subscribing.
     Unrecognised plan strings fall back to rank-0 (trial-tier subset only).
+    Returns a fresh copy of the precomputed table entry; callers may mutate it.
     """
-    resolved = plan or PLAN_TRIAL
-    if resolved == PLAN_TRIAL:
-        return {flag: True for flag in _FEATURE_MIN_PLAN}
-    rank = PLAN_RANK.get(resolved, PLAN_RANK[PLAN_TRIAL])
-    return {
-        flag: rank >= PLAN_RANK.get(min_plan, 0)
-        for flag, min_plan in _FEATURE_MIN_PLAN.items()
-    }
+    return dict(_DEFAULT_FLAGS_BY_PLAN.get(plan or PLAN_TRIAL, _UNKNOWN_PLAN_FLAGS))
 
 
 def merge_flags(*, plan: str, overrides: dict[str, Any] | None) -> dict[str, bool]:
@@ -90,3 +106,18 @@ def merge_flags(*, plan: str, overrides: dict[str, Any] | None) -> dict[str, boo
                 merged[k] = v
     return merged
 
+
+def resolve_flags(*, plan: str, overrides: dict[str, Any] | None) -> Mapping[str, bool]:
+    """
+    Same result as merge_flags(), for callers that only read the flags.
+
+    The result is a read-only mapping. With no boolean overrides it is a shared
+    view of the precomputed plan table entry (no copy).
+    """
+    base = _READONLY_FLAGS_BY_PLAN.get(plan or PLAN_TRIAL, _READONLY_UNKNOWN_PLAN_FLAGS)
+    if not overrides:
+        return base
+    bool_overrides = {k: v for k, v in overrides.items() if isinstance(v, bool)}
+    if not bool_overrides:
+        return base
+    return MappingProxyType({**base, **bool_overrides})
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+
+_SELECT_TYPES = frozenset({"select", "multiselect"})
 
 
 def build_option_label_map(form: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
@@ -8,19 +11,12 @@ def build_option_label_map(form: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
     Returns a mapping: field_key -> { option_value: option_label }
     Only for select/multiselect fields.
     """
-    out: Dict[str, Dict[str, str]] = {}
-
-    for section in form.get("sections", []):
-        for field in section.get("fields", []):
-            ftype = field.get("type")
-            if ftype not in ("select", "multiselect"):
-                continue
-
-            key = field.get("key")
-            options = field.get("options") or []
-            out[key] = {str(opt.get("value")): str(opt.get("label")) for opt in options}
-
-    return out
+    return {
+        field.get("key"): {str(opt.get("value")): str(opt.get("label")) for opt in (field.get("options") or [])}
+        for section in form.get("sections", [])
+        for field in section.get("fields", [])
+        if field.get("type") in _SELECT_TYPES
+    }
 
 
 def resolve_label(field_key: str, stored_value: Any, label_map: Dict[str, Dict[str, str]]) -> Optional[str]:
@@ -37,3 +33,71 @@ def resolve_label(field_key: str, stored_value: Any, label_map: Dict[str, Dict[s
         return ", ".join(labels)
 
     return field_map.get(str(stored_value), str(stored_value))
+
+
+class CompiledField(NamedTuple):
+    """A form field normalized once per form; see compile_form()."""
+    key: str
+    ftype: str
+    required: bool
+    label: str
+    options: list
+    max_mb: Any  # file fields only
+    max_bytes: Optional[int]
+    display: dict  # static template props (don't depend on a submission)
+
+
+CompiledForm = Tuple[Tuple[Dict[str, Any], Tuple[CompiledField, ...]], ...]
+
+
+def compile_form(form: Dict[str, Any]) -> CompiledForm:
+    """
+    Normalize a form's sections/fields: ((section, (field, ...)), ...).
+    Keyless fields are dropped. Shared by submission validation and the
+    admin/school editors; use config_loader.get_compiled_form() for the cached copy.
+    """
+    compiled = []
+    for section in form.get("sections", []):
+        fields = []
+        for f in section.get("fields", []):
+            key = f.get("key")
+            if not key:
+                continue
+            ftype = (f.get("type") or "text").strip().lower()
+            required = bool(f.get("required", False))
+            label = f.get("label") or key.replace("_", " ").title()
+            max_mb = f.get("max_mb") if ftype == "file" else None
+            max_bytes = None
+            if max_mb:
+                try:
+                    max_bytes = int(max_mb) * 1024 * 1024
+                except Exception:
+                    max_bytes = None  # unparseable limit: no limit
+            fields.append(
+                CompiledField(
+                    key=key,
+                    ftype=ftype,
+                    required=required,
+                    label=label,
+                    options=f.get("options") or [],
+                    max_mb=max_mb,
+                    max_bytes=max_bytes,
+                    display={
+                        "key": key,
+                        "label": label,
+                        "type": ftype,
+                        "required": required,
+                        # Display properties passed through for template rendering
+                        "placeholder": f.get("placeholder", ""),
+                        "help_text": f.get("help_text", ""),
+                        "full_width": bool(f.get("full_width", False)),
+                        "ui": f.get("ui", ""),
+                        "text": f.get("text", ""),            # waiver body text
+                        "link_url": f.get("link_url", ""),    # waiver link
+                        "link_text": f.get("link_text", ""),  # waiver link label
+                        "checkbox_label": f.get("checkbox_label", ""),
+                    },
+                )
+            )
+        compiled.append((section, tuple(fields)))
+    return tuple(compiled)
@@ -2,16 +2,24 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
+import hashlib
 import logging
+import re
+import threading
+import time
+from smtplib import SMTPServerDisconnected
 
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.core.mail import EmailMessage, get_connection
 from django.http import HttpRequest
 from django.core.mail import EmailMultiAlternatives
 from django.utils.html import escape
-from django.urls import reverse
+from django.urls import get_script_prefix, get_urlconf, reverse
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +46,80 @@ def get_school_email_connection(school=None):
     return get_connection(timeout=timeout)
 
 
+# Per-thread pool of open email connections, keyed by where they deliver to.
+# Email backends are not thread-safe, so each worker thread keeps its own. The pool
+# only lives for one dispatch: callers close it with close_shared_email_connections().
+_thread_email = threading.local()
+_SHARED_CONN_MAX = 8
+_SHARED_CONN_IDLE_SECONDS = 60
+
+
+def _email_connection_key(school=None) -> tuple:
+    if school and getattr(school, "smtp_host", ""):
+        return (
+            "smtp",
+            school.smtp_host,
+            school.smtp_port or 587,
+            school.smtp_username or "",
+            # Digest, not the secret: the key outlives the send in the thread's pool.
+            hashlib.sha256((school.smtp_password or "").encode()).hexdigest(),
+            bool(school.smtp_use_tls),
+        )
+    return ("default", getattr(settings, "EMAIL_BACKEND", ""))
+
+
+def _get_shared_email_connection(school=None):
+    """Like get_school_email_connection(), but opened once and reused by this thread.
+
+    Sends within one dispatch (and their reconnect retry) skip the SMTP/TLS
+    handshake after the first. Connections idle longer than
+    _SHARED_CONN_IDLE_SECONDS are reopened, since servers drop them anyway.
+    Callers must not close the returned connection; on a send failure call
+    _drop_shared_email_connection(), and close_shared_email_connections() once the
+    dispatch is done so nothing stays open between requests.
+    """
+    conns = getattr(_thread_email, "conns", None)
+    if conns is None:
+        conns = _thread_email.conns = {}
+    key = _email_connection_key(school)
+    now = time.monotonic()
+
+    entry = conns.pop(key, None)
+    if entry is not None and now - entry[1] > _SHARED_CONN_IDLE_SECONDS:
+        _close_quietly(entry[0])
+        entry = None
+    if entry is None:
+        while len(conns) >= _SHARED_CONN_MAX:
+            _close_quietly(conns.pop(next(iter(conns)))[0])
+        conn = get_school_email_connection(school)
+        conn.open()
+    else:
+        conn = entry[0]
+    conns[key] = (conn, now)  # re-inserted last: dict order doubles as LRU order
+    return conn
+
+
+def _drop_shared_email_connection(school=None) -> None:
+    conns = getattr(_thread_email, "conns", None) or {}
+    entry = conns.pop(_email_connection_key(school), None)
+    if entry is not None:
+        _close_quietly(entry[0])
+
+
+def close_shared_email_connections() -> None:
+    """Close every pooled connection this thread opened."""
+    conns = getattr(_thread_email, "conns", None)
+    while conns:
+        _close_quietly(conns.popitem()[1][0])
+
+
+def _close_quietly(conn) -> None:
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
 def _alert_smtp_failure(school) -> None:
     """Fire a one-time alert (max once per 24 h) to school owners when SMTP fails.
 
@@ -109,13 +191,26 @@ def _alert_smtp_failure(school) -> None:
 # Helpers
 # ----------------------------
 
+# Comma plus any surrounding whitespace; whitespace alone is not a separator
+# ("Office <office@school.com>" is one recipient).
+_EMAIL_SPLIT_RE = re.compile(r"\s*,\s*")
+
+
+@lru_cache(maxsize=64)
+def _parse_email_list(raw: str) -> Tuple[str, ...]:
+    # YAML recipient strings are the same for every submission of a school.
+    raw = raw.strip()
+    if "," not in raw:
+        # Single recipient (the usual case): no regex split needed.
+        return (raw,) if raw else ()
+    return tuple(p for p in _EMAIL_SPLIT_RE.split(raw) if p)
+
+
 def _split_emails(raw: str | None) -> List[str]:
     if not raw:
         return []
-    # comma-separated list
-    parts = [p.strip() for p in raw.split(",")]
-    # keep only non-empty items
-    return [p for p in parts if p]
+    # comma-separated list, empty items dropped
+    return list(_parse_email_list(raw))
 
 
 def _get_nested(d: dict, path: List[str], default=None):
@@ -127,15 +222,32 @@ def _get_nested(d: dict, path: List[str], default=None):
     return cur
 
 
+# {{key}} placeholders, exactly as written (no whitespace trimming).
+_TEMPLATE_RE = re.compile(r"\{\{([^{}]+)\}\}")
+
+
 def _render_template(s: str, context: Dict[str, Any]) -> str:
     """
     Minimal safe template: replaces {{key}} occurrences.
     (No conditionals; MVP-only, intentionally simple.)
     """
     out = s or ""
-    for k, v in (context or {}).items():
-        out = out.replace("{{" + k + "}}", str(v))
-    return out
+    if not context or "{{" not in out:
+        return out
+
+    # Substituted values are never re-scanned; unknown keys stay as written.
+    parts = _compile_template(out)
+    return "".join(
+        part if i % 2 == 0 else (str(context[part]) if part in context else "{{" + part + "}}")
+        for i, part in enumerate(parts)
+    )
+
+
+@lru_cache(maxsize=256)
+def _compile_template(s: str) -> Tuple[str, ...]:
+    # Alternating (literal, key, literal, key, ..., literal). YAML subjects and
+    # messages repeat for every submission, so each is parsed once.
+    return tuple(_TEMPLATE_RE.split(s))
 
 
 def _format_submission_lines(submission_data: Dict[str, Any]) -> str:
@@ -145,13 +257,31 @@ def _format_submission_lines(submission_data: Dict[str, Any]) -> str:
     """
     if not isinstance(submission_data, dict):
         return ""
-    lines = []
-    for k in sorted(submission_data.keys()):
-        v = submission_data.get(k)
-        if isinstance(v, list):
-            v = ", ".join([str(x) for x in v])
-        lines.append(f"{k}: {v}")
-    return "\n".join(lines)
+    return "\n".join(
+        f"{k}: {', '.join(map(str, v)) if isinstance(v, list) else v}"
+        for k, v in sorted(submission_data.items())
+    )
+
+
+_ADMIN_ID_PLACEHOLDER = "__submission_id__"
+
+
+@lru_cache(maxsize=8)
+def _admin_submission_change_path(script_prefix: str, urlconf: Optional[str]) -> str:
+    """Django admin change path for a submission, with "{}" in place of the id.
+
+    Keyed by script prefix and urlconf, the only inputs besides the id that change
+    what reverse() returns, so the resolver is walked once rather than per email.
+    """
+    path = reverse("admin:core_submission_change", args=[_ADMIN_ID_PLACEHOLDER], urlconf=urlconf)
+    return path.replace("{", "{{").replace("}", "}}").replace(_ADMIN_ID_PLACEHOLDER, "{}")
+
+
+@receiver(setting_changed)
+def _reset_admin_submission_change_path(*, setting, **kwargs):
+    if setting == "ROOT_URLCONF":
+        _admin_submission_change_path.cache_clear()
+
 
 def _admin_url_for_submission(
     *, request: Optional[HttpRequest], submission_id: int | str, school=None
@@ -160,7 +290,7 @@ def _admin_url_for_submission(
     if school is not None:
         path = f"/schools/{school.slug}/admin/submissions/{submission_id}/"
     else:
-        path = reverse("admin:core_submission_change", args=[submission_id])
+        path = _admin_submission_change_path(get_script_prefix(), get_urlconf()).format(submission_id)
     return app_url(path)
 
 
@@ -168,33 +298,25 @@ def _build_submission_email_subject(*, student_name: str, program: str) -> str:
     return f"New submission: {student_name}" + (f" ({program})" if program else "")
 
 
-def _build_submission_email_bodies(
-    *,
-    submission_public_id: str,
-    student_name: str,
-    program: str,
-    admin_url: str,
-) -> Tuple[str, str]:
-    # Plain text (fallback)
-    text_body = "\n".join([
-        "New submission received",
-        f"Application ID: {submission_public_id}",
-        f"Student: {student_name}",
-        f"Program: {program}" if program else "",
-        "",
-        f"View in admin: {admin_url}",
-        "",
-        "— student_enrollment_portal",
-    ])
+# Both bodies are plain str.format skeletons: one pass per send, no template engine.
+_SUBMISSION_TEXT = "\n".join([
+    "New submission received",
+    "Application ID: {public_id}",
+    "Student: {student_name}",
+    "{program_line}",
+    "",
+    "View in admin: {admin_url}",
+    "",
+    "— student_enrollment_portal",
+])
 
-    # HTML (nice link)
-    html_body = f"""
+_SUBMISSION_HTML = """
     <p><strong>New submission received</strong></p>
 
     <p>
-            <strong>Application ID:</strong> {escape(submission_public_id)}<br/>
-      <strong>Student:</strong> {escape(student_name)}<br/>
-      {f"<strong>Program:</strong> {escape(program)}<br/>" if program else ""}
+            <strong>Application ID:</strong> {public_id}<br/>
+      <strong>Student:</strong> {student_name}<br/>
+      {program_line}
     </p>
 
     <p>
@@ -218,6 +340,30 @@ def _build_submission_email_bodies(
       student_enrollment_portal
     </p>
     """
+
+
+def _build_submission_email_bodies(
+    *,
+    submission_public_id: str,
+    student_name: str,
+    program: str,
+    admin_url: str,
+) -> Tuple[str, str]:
+    # Plain text (fallback)
+    text_body = _SUBMISSION_TEXT.format(
+        public_id=submission_public_id,
+        student_name=student_name,
+        program_line=f"Program: {program}" if program else "",
+        admin_url=admin_url,
+    )
+
+    # HTML (nice link): values escaped once, then dropped into the static skeleton.
+    html_body = _SUBMISSION_HTML.format(
+        public_id=escape(submission_public_id),
+        student_name=escape(student_name),
+        program_line=f"<strong>Program:</strong> {escape(program)}<br/>" if program else "",
+        admin_url=admin_url,
+    )
     return text_body, html_body
 
 def _pick_program_label(submission_data: dict) -> str:
@@ -503,12 +649,30 @@ def get_submission_email_config(config_raw: Dict[str, Any]) -> Optional[Submissi
     if not isinstance(block, dict):
         return None
 
-    to_list = _split_emails(block.get("to"))
-    cc_list = _split_emails(block.get("cc"))
-    bcc_list = _split_emails(block.get("bcc"))
+    fields = (
+        block.get("to"),
+        block.get("cc"),
+        block.get("bcc"),
+        block.get("from_email"),
+        block.get("subject"),
+        getattr(settings, "DEFAULT_FROM_EMAIL", ""),
+    )
+    try:
+        return _build_submission_email_config(*fields)
+    except TypeError:  # unhashable YAML value — build without the cache
+        return _build_submission_email_config.__wrapped__(*fields)
 
-    from_email = (block.get("from_email") or "").strip() or getattr(settings, "DEFAULT_FROM_EMAIL", "")
-    subject = (block.get("subject") or "New submission").strip()
+
+@lru_cache(maxsize=64)
+def _build_submission_email_config(to, cc, bcc, from_email, subject, default_from) -> Optional[SubmissionEmailConfig]:
+    # Keyed on the block's raw values (not the config object), so configs rebuilt by
+    # apply_overrides share the entry too. The result is shared: treat it as read-only.
+    to_list = _split_emails(to)
+    cc_list = _split_emails(cc)
+    bcc_list = _split_emails(bcc)
+
+    from_email = (from_email or "").strip() or default_from
+    subject = (subject or "New submission").strip()
 
     if not to_list:
         # no recipients => treat as disabled
@@ -620,7 +784,7 @@ def send_submission_notification_email(
     )
 
     try:
-        conn = get_school_email_connection(school)
+        conn = _get_shared_email_connection(school)
 
         msg = EmailMultiAlternatives(
             subject=subject,
@@ -632,11 +796,18 @@ def send_submission_notification_email(
             connection=conn,
         )
         msg.attach_alternative(html_body, "text/html")
-        msg.send(fail_silently=False)
+        try:
+            msg.send(fail_silently=False)
+        except SMTPServerDisconnected:
+            # The reused connection went stale; reconnect once and retry.
+            _drop_shared_email_connection(school)
+            msg.connection = _get_shared_email_connection(school)
+            msg.send(fail_silently=False)
         return True
 
     except Exception:
         logger.exception("Failed to send submission notification email")
+        _drop_shared_email_connection(school)
         _alert_smtp_failure(school)
         return False
 
@@ -1,20 +1,40 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any, Dict, List, Tuple
+import re
+from datetime import date
+from typing import Any, Dict, Tuple
 
 from django.core.exceptions import ValidationError as DjValidationError
 from django.core.validators import validate_email as dj_validate_email
 
+from .config_loader import get_compiled_form
+
+
+# Same shapes strptime("%Y-%m-%d") accepted (month/day may be unpadded), but parsed
+# with one regex match and a date() constructor instead of the strptime machinery.
+_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})\Z")
+
+
+def _is_valid_date(value: str) -> bool:
+    m = _DATE_RE.match(value)
+    if m is None:
+        return False
+    try:
+        date(int(m[1]), int(m[2]), int(m[3]))
+    except ValueError:
+        return False
+    return True
+
 
 def _is_empty(value: Any) -> bool:
-    if value is None:
-        return True
-    if isinstance(value, str) and value.strip() == "":
-        return True
-    if isinstance(value, list) and len(value) == 0:
-        return True
-    return False
+    # Exact-type checks first: POST values are plain str and getlist() returns a plain
+    # list, so the common case never walks the MRO; subclasses still take isinstance.
+    t = type(value)
+    if t is str:
+        return not value.strip()
+    if t is list:
+        return not value
+    return value is None or (isinstance(value, str) and not value.strip()) or (isinstance(value, list) and not value)
 
 
 def validate_submission(
@@ -22,6 +42,8 @@ def validate_submission(
     post_data: Any,
     files_data: Any | None = None,
     partial: bool = False,
+    *,
+    config: Any | None = None,
 ) -> Tuple[Dict[str, Any], Dict[str, str]]:
     """
     Returns: (cleaned_data, errors)
@@ -30,96 +52,95 @@ def validate_submission(
     - partial=True: skip required-field enforcement (used for draft saves).
       All other validation (type coercion, format checks) still runs.
       File fields are skipped entirely in partial mode (not preserved in drafts).
+    - config: the SchoolConfig the form came from, if any; its own form dicts are
+      compiled once per config version, anything else is compiled per call.
     """
     files_data = files_data or {}
     cleaned: Dict[str, Any] = {}
     errors: Dict[str, str] = {}
-
-    for section in form.get("sections", []):
-        for field in section.get("fields", []):
-            key = field["key"]
-            ftype = (field.get("type") or "text").strip().lower()
-            required = bool(field.get("required", False))
-
-            # ✅ FILE: validate from FILES, not POST
-            if ftype == "file":
-                if partial:
-                    continue  # file fields not stored in drafts; re-upload on final submit
-
-                uploaded = files_data.get(key)
-
-                if required and not uploaded:
-                    errors[key] = "This file is required."
-                    continue
-
-                if uploaded:
-                    max_mb = field.get("max_mb")
-                    if max_mb:
-                        try:
-                            max_bytes = int(max_mb) * 1024 * 1024
-                            if uploaded.size > max_bytes:
-                                errors[key] = f"File too large. Max {max_mb} MB."
-                                continue
-                        except Exception:
-                            pass
-
-                    cleaned[key] = {
-                        "original_name": getattr(uploaded, "name", ""),
-                        "content_type": getattr(uploaded, "content_type", ""),
-                        "size_bytes": getattr(uploaded, "size", 0),
-                    }
-                else:
-                    cleaned[key] = None
-
+    # Bound once: the loop below runs per field on every POST.
+    post_get = post_data.get
+    files_get = files_data.get
+    is_empty = _is_empty
+
+    compiled_fields = [cf for _section, fields in get_compiled_form(config, form) for cf in fields]
+    for key, ftype, required, _label, _options, max_mb, max_bytes, _display in compiled_fields:
+        # ✅ FILE: validate from FILES, not POST
+        if ftype == "file":
+            if partial:
+                continue  # file fields not stored in drafts; re-upload on final submit
+
+            uploaded = files_get(key)
+
+            if required and not uploaded:
+                errors[key] = "This file is required."
                 continue
 
-            # --- non-file fields (existing logic) ---
-            raw_val = post_data.get(key)
-
-            if ftype == "multiselect":
-                raw_val = post_data.getlist(key)  # type: ignore[attr-defined]
-
-            if ftype == "waiver":
-                agreed = raw_val in ("on", "true", "True", "agreed", True)
-                if required and not agreed and not partial:
-                    errors[key] = "You must agree to continue."
-                    continue
-                cleaned[key] = agreed
+            if uploaded:
+                if max_bytes is not None:
+                    try:
+                        if uploaded.size > max_bytes:
+                            errors[key] = f"File too large. Max {max_mb} MB."
+                            continue
+                    except Exception:
+                        pass
+
+                cleaned[key] = {
+                    "original_name": getattr(uploaded, "name", ""),
+                    "content_type": getattr(uploaded, "content_type", ""),
+                    "size_bytes": getattr(uploaded, "size", 0),
+                }
+            else:
+                cleaned[key] = None
+
+            continue
+
+        # --- non-file fields (existing logic) ---
+        if ftype == "multiselect":
+            raw_val = post_data.getlist(key)  # type: ignore[attr-defined]
+        else:
+            raw_val = post_get(key)
+
+        if ftype == "waiver":
+            agreed = raw_val in ("on", "true", "True", "agreed", True)
+            if required and not agreed and not partial:
+                errors[key] = "You must agree to continue."
                 continue
-
-            if required and not partial and _is_empty(raw_val):
-                errors[key] = "This field is required."
+            cleaned[key] = agreed
+            continue
+
+        empty = is_empty(raw_val)
+        if required and not partial and empty:
+            errors[key] = "This field is required."
+            continue
+
+        if empty:
+            cleaned[key] = raw_val if ftype == "multiselect" else ""
+            continue
+
+        if ftype == "email":
+            try:
+                dj_validate_email(str(raw_val))
+            except DjValidationError:
+                errors[key] = "Enter a valid email address."
                 continue
 
-            if _is_empty(raw_val):
-                cleaned[key] = raw_val if ftype == "multiselect" else ""
+        if ftype == "date":
+            if not _is_valid_date(str(raw_val)):
+                errors[key] = "Enter a valid date (YYYY-MM-DD)."
                 continue
 
-            if ftype == "email":
-                try:
-                    dj_validate_email(str(raw_val))
-                except DjValidationError:
-                    errors[key] = "Enter a valid email address."
-                    continue
-
-            if ftype == "date":
-                try:
-                    datetime.strptime(str(raw_val), "%Y-%m-%d")
-                except Exception:
-                    errors[key] = "Enter a valid date (YYYY-MM-DD)."
-                    continue
-
-            if ftype == "number":
-                try:
-                    cleaned[key] = float(str(raw_val))
-                except Exception:
-                    errors[key] = "Enter a valid number."
-                continue
+        if ftype == "number":
+            try:
+                cleaned[key] = float(str(raw_val))
+            except Exception:
+                errors[key] = "Enter a valid number."
+            continue
 
-            if ftype == "checkbox":
-                cleaned[key] = True if raw_val in ("on", "true", "True", True) else False
-                continue
+        if ftype == "checkbox":
+            cleaned[key] = True if raw_val in ("on", "true", "True", True) else False
+            continue
 
-            cleaned[key] = raw_val
+        cleaned[key] = raw_val
 
     return cleaned, errors
@@ -5,13 +5,14 @@ import logging
 
 from django import template
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.contrib.admin.views.main import ChangeList
 from django.contrib.admin.templatetags.admin_list import PAGE_VAR
 from django.templatetags.static import static
-from django.utils.html import format_html
 from django.utils.safestring import SafeText, mark_safe
 
-from core.services.admin_themes import DEFAULT_THEME_KEY, get_theme_ui_tweaks
+from core.services.admin_themes import ADMIN_THEMES, DEFAULT_THEME_KEY, get_theme_ui_tweaks
 
 # Import the upstream Jazzmin tag library and re-export everything,
 # then override the tags that need patching.
@@ -58,13 +59,62 @@ def get_jazzmin_ui_tweaks(context):
     - the AdminPreference table doesn't exist (pre-migration)
     """
     theme_key = _resolve_user_theme_key(context)
+    if theme_key is not None and theme_key not in ADMIN_THEMES:
+        # get_theme_ui_tweaks() falls back to the default theme for unknown keys;
+        # normalise here so stale preferences share the default's cache entry.
+        theme_key = DEFAULT_THEME_KEY
+    return _processed_for_theme(theme_key)
+
+
+# Processed tweaks per theme key (None = static JAZZMIN_UI_TWEAKS setting).
+# Theme tweaks are fixed at import time, so each entry is built once per process;
+# the result is only read by templates, so the same dict is shared across renders.
+_PROCESSED_TWEAKS: dict[str | None, dict] = {}
+
+
+@receiver(setting_changed)
+def _reset_processed_tweaks(*, setting, **kwargs):
+    if setting in ("JAZZMIN_UI_TWEAKS", "STATIC_URL", "STORAGES"):
+        _PROCESSED_TWEAKS.clear()
+
+
+def _processed_for_theme(theme_key: str | None) -> dict:
+    try:
+        return _PROCESSED_TWEAKS[theme_key]
+    except KeyError:
+        pass
     if theme_key is None:
         # No user preference — fall back to static settings
         raw_tweaks = getattr(settings, "JAZZMIN_UI_TWEAKS", {})
     else:
         raw_tweaks = get_theme_ui_tweaks(theme_key)
+    ret = _PROCESSED_TWEAKS[theme_key] = _process_ui_tweaks(raw_tweaks)
+    return ret
+
+
+# Jazzmin boolean tweaks -> the CSS class each one switches on.
+_BOOL_MAP = {
+    "navbar_small_text": "text-sm",
+    "footer_small_text": "text-sm",
+    "body_small_text": "text-sm",
+    "brand_small_text": "text-sm",
+    "sidebar_nav_small_text": "text-sm",
+    "no_navbar_border": "border-bottom-0",
+    "sidebar_disable_expand": "sidebar-no-expand",
+    "sidebar_nav_child_indent": "nav-child-indent",
+    "sidebar_nav_compact_style": "nav-compact",
+    "sidebar_nav_legacy_style": "nav-legacy",
+    "sidebar_nav_flat_style": "nav-flat",
+    "layout_boxed": "layout-boxed",
+    "sidebar_fixed": "layout-fixed",
+    "navbar_fixed": "layout-navbar-fixed",
+    "footer_fixed": "layout-footer-fixed",
+    "actions_sticky_top": "sticky-top",
+}
 
-    return _process_ui_tweaks(raw_tweaks)
+
+def _classes(tweaks: dict, *args: str) -> str:
+    return " ".join([tweaks.get(arg, "") for arg in args]).strip()
 
 
 def _process_ui_tweaks(raw_overrides: dict) -> dict:
@@ -81,31 +131,10 @@ def _process_ui_tweaks(raw_overrides: dict) -> dict:
         tweaks.pop("navbar_fixed", None)
         tweaks.pop("footer_fixed", None)
 
-    bool_map = {
-        "navbar_small_text": "text-sm",
-        "footer_small_text": "text-sm",
-        "body_small_text": "text-sm",
-        "brand_small_text": "text-sm",
-        "sidebar_nav_small_text": "text-sm",
-        "no_navbar_border": "border-bottom-0",
-        "sidebar_disable_expand": "sidebar-no-expand",
-        "sidebar_nav_child_indent": "nav-child-indent",
-        "sidebar_nav_compact_style": "nav-compact",
-        "sidebar_nav_legacy_style": "nav-legacy",
-        "sidebar_nav_flat_style": "nav-flat",
-        "layout_boxed": "layout-boxed",
-        "sidebar_fixed": "layout-fixed",
-        "navbar_fixed": "layout-navbar-fixed",
-        "footer_fixed": "layout-footer-fixed",
-        "actions_sticky_top": "sticky-top",
-    }
-
-    for key, value in bool_map.items():
-        if key in tweaks:
-            tweaks[key] = value
-
-    def classes(*args: str) -> str:
-        return " ".join([tweaks.get(arg, "") for arg in args]).strip()
+    for key in list(tweaks):
+        css_class = _BOOL_MAP.get(key)
+        if css_class is not None:
+            tweaks[key] = css_class
 
     theme = tweaks.get("theme", "default")
     if theme not in _JAZZMIN_THEMES:
@@ -124,22 +153,24 @@ def _process_ui_tweaks(raw_overrides: dict) -> dict:
     ret = {
         "raw": raw_tweaks,
         "theme": {"name": theme, "src": static(_JAZZMIN_THEMES[theme])},
-        "sidebar_classes": classes("sidebar", "sidebar_disable_expand"),
-        "navbar_classes": classes("navbar", "no_navbar_border", "navbar_small_text"),
-        "body_classes": classes(
+        "sidebar_classes": _classes(tweaks, "sidebar", "sidebar_disable_expand"),
+        "navbar_classes": _classes(tweaks, "navbar", "no_navbar_border", "navbar_small_text"),
+        "body_classes": _classes(
+            tweaks,
             "accent", "body_small_text", "navbar_fixed", "footer_fixed", "sidebar_fixed", "layout_boxed"
         )
         + theme_body_classes,
-        "actions_classes": classes("actions_sticky_top"),
-        "sidebar_list_classes": classes(
+        "actions_classes": _classes(tweaks, "actions_sticky_top"),
+        "sidebar_list_classes": _classes(
+            tweaks,
             "sidebar_nav_small_text",
             "sidebar_nav_flat_style",
             "sidebar_nav_legacy_style",
             "sidebar_nav_child_indent",
             "sidebar_nav_compact_style",
         ),
-        "brand_classes": classes("brand_small_text", "brand_colour"),
-        "footer_classes": classes("footer_small_text"),
+        "brand_classes": _classes(tweaks, "brand_small_text", "brand_colour"),
+        "footer_classes": _classes(tweaks, "footer_small_text"),
         "button_classes": tweaks.get("button_classes", {}),
     }
 
@@ -152,6 +183,12 @@ def _process_ui_tweaks(raw_overrides: dict) -> dict:
     return ret
 
 
+_PAGINATOR_SPACER = (
+    '<li class="page-item">'
+    '<a class="page-link" href="javascript:void(0);" data-dt-idx="3" tabindex="0">… </a></li>'
+)
+
+
 @register.simple_tag
 def jazzmin_paginator_number(change_list: ChangeList, i: int) -> SafeText:
     """Generate an individual page index link in a paginated list.
@@ -160,51 +197,42 @@ def jazzmin_paginator_number(change_list: ChangeList, i: int) -> SafeText:
     args/kwargs, which raises `TypeError: args or kwargs must be provided` on
     Django 6+.
 
-    We keep Jazzmin's HTML output but wrap it safely.
+    We keep Jazzmin's HTML output but build it with one f-string per piece and
+    mark the joined result safe directly.
     """
+    page_num = change_list.page_num
+    parts = []
+
+    if i == 1:
+        link = change_list.get_query_string({PAGE_VAR: page_num - 1}) if page_num > 1 else "#"
+        disabled = "disabled" if link == "#" else ""
+        parts.append(
+            f'<li class="page-item previous {disabled}">'
+            f'<a class="page-link" href="{link}" data-dt-idx="0" tabindex="0">«</a></li>'
+        )
 
-    html_str = ""
-    start = i == 1
     end = i == change_list.paginator.num_pages
-    spacer = i in (".", "…")
-    current_page = i == change_list.page_num
-
-    if start:
-        link = change_list.get_query_string({PAGE_VAR: change_list.page_num - 1}) if change_list.page_num > 1 else "#"
-        html_str += """
-        <li class=\"page-item previous {disabled}\">
-            <a class=\"page-link\" href=\"{link}\" data-dt-idx=\"0\" tabindex=\"0\">«</a>
-        </li>
-        """.format(link=link, disabled="disabled" if link == "#" else "")
-
-    if current_page:
-        html_str += """
-        <li class=\"page-item active\">
-            <a class=\"page-link\" href=\"javascript:void(0);\" data-dt-idx=\"3\" tabindex=\"0\">{num}</a>
-        </li>
-        """.format(num=i)
-    elif spacer:
-        html_str += """
-        <li class=\"page-item\">
-            <a class=\"page-link\" href=\"javascript:void(0);\" data-dt-idx=\"3\" tabindex=\"0\">… </a>
-        </li>
-        """
+    if i == page_num:
+        parts.append(
+            f'<li class="page-item active">'
+            f'<a class="page-link" href="javascript:void(0);" data-dt-idx="3" tabindex="0">{i}</a></li>'
+        )
+    elif i in (".", "…"):
+        parts.append(_PAGINATOR_SPACER)
     else:
         query_string = change_list.get_query_string({PAGE_VAR: i})
         end_class = "end" if end else ""
-        html_str += """
-            <li class=\"page-item\">
-            <a href=\"{query_string}\" class=\"page-link {end}\" data-dt-idx=\"3\" tabindex=\"0\">{num}</a>
-            </li>
-        """.format(num=i, query_string=query_string, end=end_class)
+        parts.append(
+            f'<li class="page-item">'
+            f'<a href="{query_string}" class="page-link {end_class}" data-dt-idx="3" tabindex="0">{i}</a></li>'
+        )
 
     if end:
-        link = change_list.get_query_string({PAGE_VAR: change_list.page_num + 1}) if change_list.page_num < i else "#"
-        html_str += """
-        <li class=\"page-item next {disabled}\">
-            <a class=\"page-link\" href=\"{link}\" data-dt-idx=\"7\" tabindex=\"0\">»</a>
-        </li>
-        """.format(link=link, disabled="disabled" if link == "#" else "")
-
-    # Use format_html with an argument to satisfy Django's requirement.
-    return format_html("{}", mark_safe(html_str))
+        link = change_list.get_query_string({PAGE_VAR: page_num + 1}) if page_num < i else "#"
+        disabled = "disabled" if link == "#" else ""
+        parts.append(
+            f'<li class="page-item next {disabled}">'
+            f'<a class="page-link" href="{link}" data-dt-idx="7" tabindex="0">»</a></li>'
+        )
+
+    return mark_safe("".join(parts))
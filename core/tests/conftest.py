@@ -30,3 +30,13 @@ def school_admin_membership(db, user, school):
 def submission(db, school):
     """Create and return a Submission via factory."""
     return SubmissionFactory.create(school=school)
+
+
+@pytest.fixture(autouse=True)
+def _clear_stripe_subscription_cache():
+    """Mocked Stripe subscriptions must not leak between tests via the retrieve cache."""
+    from core.services import billing_stripe
+
+    billing_stripe._SUB_CACHE.clear()
+    yield
+    billing_stripe._SUB_CACHE.clear()
@@ -1,3 +1,5 @@
+import itertools
+
 import factory
 from factory import django
 from faker import Faker
@@ -56,13 +58,33 @@ class SubmissionFactory(django.DjangoModelFactory):
         model = "core.Submission"
 
     school = factory.SubFactory(SchoolFactory)
-    data = factory.LazyFunction(lambda: {
+    data = factory.LazyFunction(lambda: _next_submission_data())
+
+
+def _fake_submission_data():
+    return {
         "first_name": fake.first_name(),
         "last_name": fake.last_name(),
         "class_name": fake.word().title() + " Class",
         "dance_style": fake.word(ext_word_list=["ballet", "jazz", "hiphop", "contemporary"]) ,
         "skill_level": fake.random_element(elements=("beginner", "intermediate", "advanced")),
-    })
+    }
+
+
+# Faker calls dominate SubmissionFactory time when tests create submissions in bulk.
+# Generate a pool once (on first use) and cycle through it; each submission gets its
+# own copy so tests can mutate `data` freely.
+_SUBMISSION_DATA_POOL_SIZE = 500
+_submission_data_pool = None
+
+
+def _next_submission_data():
+    global _submission_data_pool
+    if _submission_data_pool is None:
+        _submission_data_pool = itertools.cycle(
+            [_fake_submission_data() for _ in range(_SUBMISSION_DATA_POOL_SIZE)]
+        )
+    return dict(next(_submission_data_pool))
 
 
 class LeadFactory(django.DjangoModelFactory):
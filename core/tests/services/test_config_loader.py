@@ -50,3 +50,60 @@ def test_display_name_fallback_and_branding_defaults(settings):
     b = cfg.branding
     assert isinstance(b, dict)
     assert "theme" in b and "primary_color" in b["theme"]
+
+
+def test_derived_properties_are_computed_once_per_instance(settings):
+    settings.BASE_DIR = str(FIXTURES_DIR)
+    cfg = config_loader.load_school_config("valid-school")
+    assert cfg.branding is cfg.branding
+    assert cfg.form is cfg.form
+    assert cfg.merged_branding is cfg.merged_branding
+    assert cfg.merged_branding == config_loader.merge_branding(cfg.branding)
+
+
+def test_load_is_cached_until_file_changes(settings, tmp_path):
+    schools_dir = tmp_path / "configs" / "schools"
+    schools_dir.mkdir(parents=True)
+    path = schools_dir / "cached-school.yaml"
+    path.write_text("school:\n  slug: cached-school\n  display_name: Before\n")
+    settings.BASE_DIR = str(tmp_path)
+
+    first = config_loader.load_school_config("cached-school")
+    assert config_loader.load_school_config("cached-school") is first
+
+    path.write_text("school:\n  slug: cached-school\n  display_name: After (edited)\n")
+    reloaded = config_loader.load_school_config("cached-school")
+    assert reloaded is not first
+    assert reloaded.display_name == "After (edited)"
+
+
+def test_edited_file_replaces_its_cache_entry(settings, tmp_path):
+    schools_dir = tmp_path / "configs" / "schools"
+    schools_dir.mkdir(parents=True)
+    path = schools_dir / "one-entry.yaml"
+    path.write_text("school:\n  slug: one-entry\n")
+    settings.BASE_DIR = str(tmp_path)
+
+    config_loader.load_school_config("one-entry")
+    path.write_text("school:\n  slug: one-entry\n  display_name: Edited\n")
+    cfg = config_loader.load_school_config("one-entry")
+
+    assert config_loader._CONFIG_CACHE[str(path)][1] is cfg
+
+
+def test_option_label_map_is_memoized_per_config_version(settings, tmp_path):
+    schools_dir = tmp_path / "configs" / "schools"
+    schools_dir.mkdir(parents=True)
+    path = schools_dir / "labels-school.yaml"
+    path.write_text(
+        "school:\n  slug: labels-school\n"
+        "form:\n  sections:\n    - fields:\n"
+        "        - {key: program, type: select, options: [{value: a, label: Alpha}]}\n"
+    )
+    settings.BASE_DIR = str(tmp_path)
+
+    cfg = config_loader.load_school_config("labels-school")
+    label_map = config_loader.get_option_label_map(cfg)
+    assert label_map == {"program": {"a": "Alpha"}}
+    assert config_loader.get_option_label_map(cfg) is label_map
+    assert config_loader.get_option_label_map(None) == {}
@@ -12,6 +12,7 @@ from core.services.feature_flags import (
     _FEATURE_MIN_PLAN,
     default_flags_for_plan,
     merge_flags,
+    resolve_flags,
 )
 
 
@@ -201,3 +202,22 @@ def test_merge_flags_override_can_disable_trial_feature():
     result = merge_flags(plan=PLAN_TRIAL, overrides={"custom_branding_enabled": False})
     assert result["custom_branding_enabled"] is False
 
+
+
+def test_resolve_flags_matches_merge_flags():
+    for overrides in (None, {}, {"reports_enabled": "yes"}, {"reports_enabled": False, "new_flag": True}):
+        assert dict(resolve_flags(plan=PLAN_STARTER, overrides=overrides)) == merge_flags(
+            plan=PLAN_STARTER, overrides=overrides
+        )
+
+
+def test_resolve_flags_without_overrides_shares_the_plan_table():
+    assert resolve_flags(plan=PLAN_PRO, overrides=None) is resolve_flags(plan=PLAN_PRO, overrides={})
+
+
+def test_resolve_flags_result_is_read_only():
+    for overrides in (None, {"reports_enabled": False}):
+        flags = resolve_flags(plan=PLAN_STARTER, overrides=overrides)
+        with pytest.raises(TypeError):
+            flags["reports_enabled"] = True
+    assert merge_flags(plan=PLAN_STARTER, overrides=None) == dict(resolve_flags(plan=PLAN_STARTER, overrides=None))
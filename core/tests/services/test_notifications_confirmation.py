@@ -15,6 +15,7 @@ from core.services.notifications import (
     ApplicantConfirmationConfig,
     _build_confirmation_email_bodies,
     _find_applicant_email,
+    _render_template,
     get_applicant_confirmation_config,
     send_applicant_confirmation_email,
 )
@@ -499,3 +500,11 @@ def test_send_confirmation_email_no_scheduling_when_not_configured(settings):
 
     assert len(mail.outbox) == 1
     assert "calendly" not in mail.outbox[0].body
+
+
+def test_render_template_single_pass_leaves_unknown_placeholders():
+    out = _render_template(
+        "Hi {{student_name}} — {{program}} {{unknown}}",
+        {"student_name": "{{program}}", "program": "Ballet"},
+    )
+    assert out == "Hi {{program}} — Ballet {{unknown}}"
@@ -63,6 +63,18 @@ def test_type_validations_email_date_number_and_checkbox():
     assert cleaned2["agree"] is False
 
 
+def test_date_validation_accepts_strptime_shapes_only():
+    form = load_form("types")
+
+    for value in ("2020-01-02", "2020-1-2"):
+        _, errors = validation.validate_submission(form, DummyPost({"dob": value}))
+        assert "dob" not in errors, value
+
+    for value in ("2021-02-29", "20200102", "2020-01-02T00:00", "02/01/2020"):
+        _, errors = validation.validate_submission(form, DummyPost({"dob": value}))
+        assert errors["dob"].startswith("Enter a valid date"), value
+
+
 def test_select_and_multiselect_are_accepted_and_multiselect_returns_list():
     form = load_form("selects")
 
@@ -84,3 +96,24 @@ def test_empty_optional_fields_result_in_empty_cleaned_values():
     assert not errors
     assert cleaned["choice"] == ""
     assert cleaned["picks"] == []
+
+
+def test_config_forms_are_compiled_once_and_copies_are_not_cached():
+    import copy
+
+    from core.services.config_loader import SchoolConfig, get_compiled_form
+
+    cfg = SchoolConfig(raw={"school": {"slug": "compiled"}, "form": load_form("required")})
+    form = cfg.form
+
+    validation.validate_submission(form, DummyPost({}), config=cfg)
+    compiled = get_compiled_form(cfg, form)
+    cleaned, errors = validation.validate_submission(form, DummyPost({"name": "Ada"}), config=cfg)
+
+    assert get_compiled_form(cfg, form) is compiled
+    assert not errors and cleaned["name"] == "Ada"
+    # A per-request copy is compiled on the fly and never stored on the config.
+    memo_size = len(cfg._memo)
+    per_request = copy.deepcopy(form)
+    assert get_compiled_form(cfg, per_request) is not get_compiled_form(cfg, per_request)
+    assert len(cfg._memo) == memo_size
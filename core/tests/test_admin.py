@@ -136,6 +136,26 @@ def test_school_scoped_user_admin_get_queryset_and_save_model(db):
     assert hasattr(new_user, "school_membership") or school.admin_memberships.filter(user=new_user).exists()
 
 
+def test_school_scoped_user_admin_get_queryset_scopes_to_membership_school(db):
+    User = get_user_model()
+    admin_instance = core_admin.SchoolScopedUserAdmin(User, admin.site)
+
+    school = SchoolFactory.create()
+    other_school = SchoolFactory.create()
+    staff = UserFactory.create(is_staff=True)
+    SchoolAdminMembershipFactory.create(user=staff, school=school)
+    colleague = UserFactory.create(is_staff=True)
+    SchoolAdminMembershipFactory.create(user=colleague, school=school)
+    outsider = UserFactory.create(is_staff=True)
+    SchoolAdminMembershipFactory.create(user=outsider, school=other_school)
+
+    req = RequestFactory().get("/")
+    req.user = staff
+
+    ids = set(admin_instance.get_queryset(req).values_list("id", flat=True))
+    assert ids == {staff.id, colleague.id}
+
+
 def test_submission_admin_display_and_get_list_display(db):
     su = UserFactory.create(is_superuser=True, is_staff=True)
     non_su = UserFactory.create(is_staff=True)
@@ -186,6 +206,11 @@ def test_pretty_json_widget_formatting():
     out = w.format_value(object())
     assert out is not None
 
+    # a string that merely looks like pretty JSON is still parsed, not passed through
+    looks_pretty = '{\n  "a": 1,\n  broken'
+    assert w.format_value(looks_pretty) == looks_pretty
+    assert w.format_value('{\n  "b": 2,\n  "a": 1\n}') == '{\n  "a": 1,\n  "b": 2\n}'
+
 
 def test_useradmin_get_form_and_membership_queryset(db):
     User = get_user_model()
@@ -367,6 +392,24 @@ def test_submission_admin_permissions_and_queryset_scoping(db):
     assert ma.has_view_permission(req, obj=other) is False
 
 
+def test_submission_admin_get_queryset_joins_school(db):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    school = SchoolFactory.create()
+    SubmissionFactory.create_batch(3, school=school)
+    su = UserFactory.create(is_superuser=True, is_staff=True)
+
+    ma = SubmissionAdmin(Submission, admin_site)
+    req = RequestFactory().get("/")
+    req.user = su
+
+    with CaptureQueriesContext(connection) as ctx:
+        slugs = [s.school.slug for s in ma.get_queryset(req)]
+    assert slugs == [school.slug] * 3
+    assert len(ctx.captured_queries) == 1
+
+
 def test_submission_admin_change_view_denies_wrong_school(db):
     school1 = SchoolFactory.create()
     school2 = SchoolFactory.create()
@@ -1137,6 +1180,26 @@ def test_submission_admin_save_model_creates_audit_when_enabled(monkeypatch):
     assert AdminAuditLog.objects.count() > initial_count
 
 
+@pytest.mark.django_db
+def test_submission_admin_export_csv_columns_are_sorted_row_keys():
+    school = SchoolFactory.create(plan="trial", feature_flags={"audit_log_enabled": False})
+    SubmissionFactory.create(
+        school=school,
+        data={"first_name": "Ada", "waiver__at": "2024-01-01T00:00:00", "old_field": "kept"},
+    )
+
+    su = UserFactory.create(is_superuser=True, is_staff=True)
+    req = RequestFactory().get("/")
+    req.user = su
+
+    ma = SubmissionAdmin(Submission, admin_site)
+    response = ma.export_csv(req, Submission.objects.filter(school=school))
+    rows = list(csv.reader(b"".join(response.streaming_content).decode().splitlines()))
+
+    assert rows[0] == ["created_at", "student_name", "first_name", "old_field", "waiver__at"]
+    assert rows[1][2:] == ["Ada", "kept", "2024-01-01T00:00:00"]
+
+
 @pytest.mark.django_db
 def test_submission_admin_export_csv_skips_audit_when_audit_disabled():
     school = SchoolFactory.create(plan="trial", feature_flags={"audit_log_enabled": False})
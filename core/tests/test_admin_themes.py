@@ -74,6 +74,19 @@ class TestThemeRegistry:
         midnight2 = get_theme_ui_tweaks("midnight")
         assert midnight == midnight2
 
+    def test_processed_tweaks_are_built_once_per_theme(self, settings):
+        from core.templatetags.jazzmin import _processed_for_theme
+
+        midnight = _processed_for_theme("midnight")
+        assert _processed_for_theme("midnight") is midnight
+        assert _processed_for_theme("clean") is not midnight
+
+        static_tweaks = _processed_for_theme(None)
+        settings.JAZZMIN_UI_TWEAKS = {"theme": "flatly"}
+        rebuilt = _processed_for_theme(None)
+        assert rebuilt is not static_tweaks
+        assert rebuilt["theme"]["name"] == "flatly"
+
     def test_get_themes_for_api_returns_list_of_dicts(self):
         result = get_themes_for_api()
         assert isinstance(result, list)
@@ -152,6 +152,52 @@ def test_submission_notification_email_includes_application_id(settings):
     assert any("PUB_ABC123" in (alt_body or "") for alt_body, _mime in getattr(msg, "alternatives", []))
 
 
+def test_shared_email_connections_key_on_password_digest_and_close():
+    from types import SimpleNamespace
+
+    from core.services import notifications
+
+    school = SimpleNamespace(
+        smtp_host="smtp.example.com", smtp_port=587, smtp_username="u", smtp_password="s3cret", smtp_use_tls=True
+    )
+    assert "s3cret" not in notifications._email_connection_key(school)
+
+    conn = mock.Mock()
+    notifications._thread_email.conns = {("smtp", "x"): (conn, 0.0)}
+    notifications.close_shared_email_connections()
+
+    conn.close.assert_called_once_with()
+    assert notifications._thread_email.conns == {}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_submission_emails_send_from_pool_and_close_connections(settings):
+    from core.tests.factories import SubmissionFactory
+    from core.views_public import _dispatch_submission_emails
+
+    settings.EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+    settings.EMAIL_ASYNC = True
+    mail.outbox.clear()
+    submission = SubmissionFactory()
+    config_raw = {
+        "success": {
+            "notifications": {
+                "submission_email": {"to": "to@example.com", "from_email": "no-reply@example.com"}
+            }
+        }
+    }
+
+    with mock.patch("core.views_public.close_old_connections") as close_conns:
+        future = _dispatch_submission_emails(None, submission.school, submission, config_raw, "Test School")
+        assert future is not None
+        future.result(timeout=10)
+
+    close_conns.assert_called_once_with()
+    assert len(mail.outbox) == 1
+    assert mail.outbox[0].to == ["to@example.com"]
+    assert submission.public_id in mail.outbox[0].body
+
+
 # ---------------------------------------------------------------------------
 # Inactive school enforcement tests
 # ---------------------------------------------------------------------------
@@ -180,6 +180,31 @@ class TestHandleSubscriptionUpdated:
         """Should not crash for unknown subscription."""
         handle_subscription_updated({"id": "sub_unknown", "status": "active", "items": {"data": []}})
 
+    def test_subscription_id_match_wins_over_metadata_slug(self):
+        by_slug = SchoolFactory(slug="meta-school", stripe_subscription_status="active")
+        by_sub = SchoolFactory(stripe_subscription_id="sub_both", stripe_subscription_status="active")
+        handle_subscription_updated({
+            "id": "sub_both",
+            "status": "past_due",
+            "metadata": {"school_slug": "meta-school"},
+            "items": {"data": []},
+        })
+        by_sub.refresh_from_db()
+        by_slug.refresh_from_db()
+        assert by_sub.stripe_subscription_status == "past_due"
+        assert by_slug.stripe_subscription_status == "active"
+
+    def test_falls_back_to_metadata_slug(self):
+        school = SchoolFactory(slug="early-event", stripe_subscription_status="")
+        handle_subscription_updated({
+            "id": "sub_new",
+            "status": "active",
+            "metadata": {"school_slug": "early-event"},
+            "items": {"data": []},
+        })
+        school.refresh_from_db()
+        assert school.stripe_subscription_status == "active"
+
     def test_scheduled_cancel_does_not_lock(self):
         """subscription.updated with cancel_at should NOT lock the school yet."""
         from datetime import datetime, timedelta
@@ -986,6 +1011,29 @@ class TestBillingCancelReminders:
         assert any("overdue-school" in record.message for record in caplog.records if record.levelname == "ERROR")
         assert any("manual deactivation needed" in record.message for record in caplog.records if record.levelname == "ERROR")
 
+    def test_past_cancel_at_with_far_period_end_is_only_overdue(self, caplog):
+        from datetime import timedelta
+        from django.utils import timezone as djtz
+        from io import StringIO
+        from django.core.management import call_command
+
+        SchoolFactory(
+            slug="mixed-dates-school",
+            is_active=True,
+            stripe_cancel_at=djtz.now() - timedelta(days=1),
+            stripe_cancel_at_period_end=True,
+            stripe_current_period_end=djtz.now() + timedelta(days=30),
+        )
+
+        out = StringIO()
+        with caplog.at_level("WARNING"):
+            call_command("billing_cancel_reminders", stdout=out)
+
+        output = out.getvalue()
+        assert "0 upcoming" in output
+        assert "1 overdue" in output
+        assert not any("will cancel on" in record.message for record in caplog.records)
+
     def test_excludes_schools_beyond_3_days(self):
         from datetime import timedelta
         from django.utils import timezone as djtz
@@ -1247,6 +1295,23 @@ class TestExpiredTrialUpgradeFlow:
         assert school.stripe_customer_id == "cus_idem"
         assert school.stripe_subscription_id == "sub_idem"
 
+    def test_duplicate_checkout_webhooks_retrieve_subscription_once(self):
+        """Retried checkout events reuse the cached subscription until an update evicts it."""
+        school = SchoolFactory(plan="trial")
+        data = _checkout_session_data(school.slug, "cus_once", "sub_once")
+
+        with patch("core.services.billing_stripe._get_stripe") as m:
+            retrieve = m.return_value.Subscription.retrieve
+            retrieve.return_value = _mock_sub_with_price()
+            with override_settings(**_STARTER_OVERRIDE):
+                handle_checkout_completed(data)
+                handle_checkout_completed(data)
+                assert retrieve.call_count == 1
+
+                handle_subscription_updated({"id": "sub_once", "status": "active", "items": {"data": []}})
+                handle_checkout_completed(data)
+                assert retrieve.call_count == 2
+
     # ── Test 3: canceled checkout leaves school untouched ───────────────────
 
     def test_canceled_checkout_leaves_school_unchanged(self, client):
@@ -6,7 +6,7 @@ from django.db.migrations.executor import MigrationExecutor
 from core.tests.factories import SchoolFactory, SubmissionFactory
 from django.core.files.uploadedfile import SimpleUploadedFile
 
-from core.models import School, SchoolFeatures, SubmissionFile
+from core.models import School, SchoolFeatures, Submission, SubmissionFile, create_submissions_bulk
 from core.services.feature_flags import (
     PLAN_TRIAL, PLAN_STARTER, PLAN_PRO, PLAN_GROWTH, PLAN_CHOICES,
 )
@@ -66,6 +66,25 @@ def test_program_display_name_tsca_and_empty_cases():
     sub2 = SubmissionFactory(school=other, data={})
     assert sub2.program_display_name() == ""
 
+
+@pytest.mark.django_db
+def test_program_display_names_matches_per_row_resolution():
+    school = SchoolFactory()
+    tsca = SchoolFactory(slug="torrance-sister-city-association")
+    subs = [
+        SubmissionFactory(school=school, data={"class_name": "cls-101"}),
+        SubmissionFactory(school=school, data={"class_name": "cls-101"}),
+        SubmissionFactory(school=school, data={"program": ["a", "b"]}),
+        SubmissionFactory(school=tsca, data={}),
+    ]
+    label_map = {"class_name": {"cls-101": "Intro Class"}}
+
+    names = Submission.program_display_names(subs, label_map)
+
+    assert names == {s.id: s.program_display_name(label_map=label_map) for s in subs}
+    assert names[subs[0].id] == "Intro Class"
+    assert names[subs[3].id] == "Student Exchange"
+
 @pytest.mark.django_db
 def test_submissionfile_str_includes_school_slug_submission_and_field_key():
     sub = SubmissionFactory()
@@ -209,6 +228,18 @@ def test_school_features_reports_enabled_respects_override():
     assert school2.features.reports_enabled is False
 
 
+@pytest.mark.django_db
+def test_school_features_follow_plan_and_override_reassignment():
+    school = SchoolFactory(plan="starter")
+    assert school.features.ai_summary_enabled is False
+
+    school.plan = "growth"
+    assert school.features.ai_summary_enabled is True
+
+    school.feature_flags = {"ai_summary_enabled": False}
+    assert school.features.ai_summary_enabled is False
+
+
 @pytest.mark.django_db
 def test_school_features_status_enabled_defaults_true():
     school = SchoolFactory(plan="trial")
@@ -424,3 +455,20 @@ def test_save_resume_enabled_pro_plan():
 def test_save_resume_disabled_starter_plan():
     school = SchoolFactory(plan="starter")
     assert school.features.save_resume_enabled is False
+
+
+@pytest.mark.django_db
+def test_create_submissions_bulk_numbers_and_indexes_rows():
+    school = SchoolFactory()
+    SubmissionFactory(school=school)
+
+    rows = create_submissions_bulk(
+        school,
+        [{"first_name": "Ada", "last_name": "Lovelace"}, {"first_name": "Alan", "interests": ["Chess"]}],
+    )
+
+    assert [r.school_submission_number for r in rows] == [2, 3]
+    assert len({r.public_id for r in rows}) == 2
+    stored = Submission.objects.get(public_id=rows[1].public_id)
+    assert stored.search_text.startswith("Alan")
+    assert "chess" in stored.data_search_text
@@ -87,6 +87,12 @@ def test_admin_url_without_school_falls_back_to_django_admin(school):
     assert "/admin/core/submission/42/change/" in url
 
 
+def test_admin_url_without_school_matches_reverse_for_each_id():
+    for submission_id in (7, 1234):
+        url = _admin_url_for_submission(request=None, submission_id=submission_id)
+        assert url.endswith(reverse("admin:core_submission_change", args=[submission_id]))
+
+
 @pytest.mark.django_db
 def test_admin_url_school_slug_is_correct(school):
     url = _admin_url_for_submission(request=None, submission_id=99, school=school)
@@ -200,7 +200,13 @@ def test_management_ensure_superuser(monkeypatch, db):
     monkeypatch.setenv("DJANGO_SUPERUSER_EMAIL", "ci@example.com")
 
     call_command("ensure_superuser")
-    assert User.objects.filter(username="ciadmin").exists()
+    user = User.objects.get(username="ciadmin")
+    assert user.is_staff and user.is_superuser
+    assert user.check_password("pass")
+
+    # second run is a no-op
+    call_command("ensure_superuser")
+    assert User.objects.filter(username="ciadmin").count() == 1
 
 
 class _DummyCfg:
@@ -78,7 +78,7 @@ def test_submission_admin_export_csv_and_search(db):
     qs = Submission.objects.filter(id__in=[s1.id, s2.id])
     resp = sub_admin.export_csv(req, qs)
     assert resp["Content-Type"] == "text/csv"
-    text = resp.content.decode("utf-8")
+    text = b"".join(resp.streaming_content).decode("utf-8")
     # basic CSV structure: has header and at least two rows
     rows = list(csv.reader(text.splitlines()))
     assert len(rows) >= 3
@@ -5,6 +5,7 @@ import json
 import logging
 import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from collections import Counter
 from datetime import date, datetime, timedelta
 from urllib.parse import urlencode
@@ -62,6 +63,7 @@ from .services.config_loader import (
     get_lead_form_config,
     get_program_options,
     load_school_config,
+    merge_branding,
     PROGRAM_FIELD_KEYS,
 )
 from .services.billing_stripe import (
@@ -83,6 +85,7 @@ from core.admin.audit import log_admin_audit
 from .services.programs import inject_db_program_options, get_program_options, has_enrollment_options
 from .services.validation import validate_submission
 from .services.notifications import (
+    close_shared_email_connections,
     send_applicant_confirmation_email,
     send_lead_admin_notification,
     send_lead_confirmation,
@@ -137,43 +140,16 @@ def _plain_post_values(post_data, form_cfg: dict) -> dict:
     return result
 
 
-# Phase 9: default branding (used when YAML has missing branding keys)
-DEFAULT_BRANDING = {
-    "logo_url": None,
-    "theme": {
-        "primary_color": "#111827",
-        "accent_color": "#ea580c",
-        "background": "#f7f7fb",
-        "card": "#ffffff",
-        "text": "#111827",
-        "muted": "#6b7280",
-        "border": "#e5e7eb",
-        "radius": "16px",
-    },
-    "custom_css": None,
-    "custom_js": None,
-}
-
-
-def merge_branding(branding_in: dict | None) -> dict:
-    branding_in = branding_in or {}
-
-    merged = {
-        "logo_url": branding_in.get("logo_url", DEFAULT_BRANDING["logo_url"]),
-        "custom_css": branding_in.get("custom_css", DEFAULT_BRANDING["custom_css"]),
-        "custom_js": branding_in.get("custom_js", DEFAULT_BRANDING["custom_js"]),
-        "theme": DEFAULT_BRANDING["theme"].copy(),
-    }
-
-    theme_in = branding_in.get("theme") or {}
-    merged["theme"].update(theme_in)
-
-    if not merged["theme"].get("accent_color"):
-        merged["theme"]["accent_color"] = DEFAULT_BRANDING["theme"]["accent_color"]
-    if not merged["theme"].get("primary_color"):
-        merged["theme"]["primary_color"] = merged["theme"]["text"] or DEFAULT_BRANDING["theme"]["text"]
+def _config_branding(config) -> dict:
+    """config.merged_branding (merged once per SchoolConfig), as a shallow copy.
 
-    return merged
+    Views null out custom_css/custom_js per request, while the nested theme dict
+    is only ever read.
+    """
+    merged = getattr(config, "merged_branding", None) if config else None
+    if merged is None:
+        merged = merge_branding(getattr(config, "branding", None) if config else None)
+    return {**merged}
 
 
 # -----------------------------
@@ -451,35 +427,7 @@ def _complete_submission_from_draft(
         _save_uploaded_files(submission, form_cfg, request.FILES)
 
     if school.features.email_notifications_enabled:
-        try:
-            send_submission_notification_email(
-                request=request,
-                config_raw=raw_config,
-                school_name=config.display_name,
-                submission_id=submission.id,
-                submission_public_id=submission.public_id,
-                student_name=submission.student_display_name(),
-                submission_data=submission.data or {},
-                school=school,
-            )
-        except Exception:
-            logger.exception("Failed to send submission notification email")
-        try:
-            _status_url = ""
-            if school.features.family_portal_enabled:
-                from core.services.url_builder import app_reverse
-                _status_url = app_reverse("family_status", kwargs={"school_slug": school_slug, "token": submission.status_token})
-            send_applicant_confirmation_email(
-                config_raw=raw_config,
-                school_name=config.display_name,
-                submission_public_id=submission.public_id,
-                student_name=submission.student_display_name(),
-                submission_data=submission.data or {},
-                status_url=_status_url,
-                school=school,
-            )
-        except Exception:
-            logger.exception("Failed to send applicant confirmation email")
+        _dispatch_submission_emails(request, school, submission, raw_config, config.display_name)
 
     # Resolve program/session FK + auto-enroll for DB-driven program schools.
     if school.program_field_key:
@@ -522,7 +470,7 @@ def apply_view(request, school_slug: str, form_key: str = "default"):
     if config is None:
         raise Http404("School config not found")
 
-    branding = merge_branding(getattr(config, "branding", None))
+    branding = _config_branding(config)
     school = _get_or_create_school_from_config(school_slug, config, branding)
     config = apply_overrides(config, school.config_overrides)
 
@@ -562,7 +510,7 @@ def apply_view(request, school_slug: str, form_key: str = "default"):
         if request.method == "POST":
             # Save-draft action (secondary submit button)
             if request.POST.get("_action") == "save_draft" and save_resume_enabled:
-                cleaned, _ = validate_submission(form_cfg, request.POST, request.FILES, partial=True)
+                cleaned, _ = validate_submission(form_cfg, request.POST, request.FILES, partial=True, config=config)
                 active_draft = _resolve_active_draft(request, school, school_slug)
                 draft = _save_draft(
                     school=school, form_key="default", cleaned=cleaned,
@@ -580,7 +528,7 @@ def apply_view(request, school_slug: str, form_key: str = "default"):
                 return redirect(request.path)
 
             # Normal full submit
-            cleaned, errors = validate_submission(form_cfg, request.POST, request.FILES)
+            cleaned, errors = validate_submission(form_cfg, request.POST, request.FILES, config=config)
 
             # Block submission when program_field_key is set but no enrollment options exist
             if not errors and school.program_field_key:
@@ -692,35 +640,7 @@ def apply_view(request, school_slug: str, form_key: str = "default"):
             if school.features.file_uploads_enabled:
                 _save_uploaded_files(submission, form_cfg, request.FILES)
             if school.features.email_notifications_enabled:
-                try:
-                    send_submission_notification_email(
-                        request=request,
-                        config_raw=raw_config,
-                        school_name=config.display_name,
-                        submission_id=submission.id,
-                        submission_public_id=submission.public_id,
-                        student_name=submission.student_display_name(),
-                        submission_data=submission.data or {},
-                        school=school,
-                    )
-                except Exception:
-                    logger.exception("Failed to send submission notification email")
-                try:
-                    _status_url = ""
-                    if school.features.family_portal_enabled:
-                        from core.services.url_builder import app_reverse
-                        _status_url = app_reverse("family_status", kwargs={"school_slug": school_slug, "token": submission.status_token})
-                    send_applicant_confirmation_email(
-                        config_raw=raw_config,
-                        school_name=config.display_name,
-                        submission_public_id=submission.public_id,
-                        student_name=submission.student_display_name(),
-                        submission_data=submission.data or {},
-                        status_url=_status_url,
-                        school=school,
-                    )
-                except Exception:
-                    logger.exception("Failed to send applicant confirmation email")
+                _dispatch_submission_emails(request, school, submission, raw_config, config.display_name)
 
             _maybe_set_waitlist_flag(request, school, submission.data or {}, raw_config)
             request.session["_enrollify_last_form_key"] = form_key
@@ -771,7 +691,7 @@ def apply_view(request, school_slug: str, form_key: str = "default"):
     if request.method == "POST":
         # Save-draft action (secondary submit button) — mirrors single-form behavior
         if request.POST.get("_action") == "save_draft" and save_resume_enabled:
-            cleaned, _ = validate_submission(form_cfg, request.POST, request.FILES, partial=True)
+            cleaned, _ = validate_submission(form_cfg, request.POST, request.FILES, partial=True, config=config)
             draft = _save_draft(
                 school=school, form_key="multi", cleaned=cleaned,
                 config_raw=raw_config, last_form_key=form_key, draft=active_draft,
@@ -787,7 +707,7 @@ def apply_view(request, school_slug: str, form_key: str = "default"):
                 messages.info(request, "Draft saved. Fill in your email to receive a resume link.")
             return redirect(request.path)
 
-        cleaned, errors = validate_submission(form_cfg, request.POST, request.FILES)
+        cleaned, errors = validate_submission(form_cfg, request.POST, request.FILES, config=config)
 
         # Block submission when program_field_key is set but no enrollment options exist
         if not errors and school.program_field_key:
@@ -888,7 +808,7 @@ def apply_payment_view(request, school_slug: str, draft_token: str):
     if config is None:
         raise Http404("School config not found")
 
-    branding = merge_branding(getattr(config, "branding", None))
+    branding = _config_branding(config)
     school = _get_or_create_school_from_config(school_slug, config, branding)
     config = apply_overrides(config, school.config_overrides)
 
@@ -1000,7 +920,7 @@ def apply_payment_confirm_view(request, school_slug: str, draft_token: str):
     if config is None:
         raise Http404("School config not found")
 
-    branding = merge_branding(getattr(config, "branding", None))
+    branding = _config_branding(config)
     school = _get_or_create_school_from_config(school_slug, config, branding)
     config = apply_overrides(config, school.config_overrides)
 
@@ -1028,7 +948,7 @@ def apply_payment_confirm_view(request, school_slug: str, draft_token: str):
 
     if intent_status != "succeeded":
         raw_config = getattr(config, "raw", {}) or {}
-        branding = merge_branding(getattr(config, "branding", None))
+        branding = _config_branding(config)
         from core.services.url_builder import app_reverse
         return render(request, "apply_payment.html", {
             "school": school,
@@ -1076,7 +996,7 @@ def apply_payment_bypass_view(request, school_slug: str, draft_token: str):
     if config is None:
         raise Http404("School config not found")
 
-    branding = merge_branding(getattr(config, "branding", None))
+    branding = _config_branding(config)
     school = _get_or_create_school_from_config(school_slug, config, branding)
     config = apply_overrides(config, school.config_overrides)
     draft = get_object_or_404(DraftSubmission, token=draft_token, school=school)
@@ -1121,7 +1041,7 @@ def apply_success_view(request, school_slug: str):
         raise Http404("School config not found")
 
     # Branding defaults (same as apply_view)
-    branding = merge_branding(getattr(config, "branding", None))
+    branding = _config_branding(config)
 
     # Apply per-school config overrides (fees, messages, URLs) before reading success config.
     _school = School.objects.filter(slug=school_slug).first()
@@ -1207,7 +1127,7 @@ def resume_draft_view(request, school_slug: str, token: str):
     if config is None:
         raise Http404("School config not found")
 
-    branding = merge_branding(getattr(config, "branding", None))
+    branding = _config_branding(config)
     school = _get_or_create_school_from_config(school_slug, config, branding)
     config = apply_overrides(config, school.config_overrides)
 
@@ -1266,6 +1186,98 @@ def school_trial_page_view(request, school_slug):
 
 # ---------------------------------------------------------------------------
 
+def _send_submission_emails(
+    school, submission_id, public_id, student_name, data, raw, school_name, status_url, request=None
+):
+    """Send the admin notification and applicant confirmation for a new submission.
+
+    Takes plain values only (no unsaved state) so it can run in a background thread;
+    the request is only passed on the synchronous path. Each send is isolated so one
+    failure doesn't skip the other.
+    """
+    try:
+        send_submission_notification_email(
+            request=request,
+            config_raw=raw,
+            school_name=school_name,
+            submission_id=submission_id,
+            submission_public_id=public_id,
+            student_name=student_name,
+            submission_data=data,
+            school=school,
+        )
+    except Exception:
+        logger.exception("Failed to send submission notification email")
+    try:
+        send_applicant_confirmation_email(
+            config_raw=raw,
+            school_name=school_name,
+            submission_public_id=public_id,
+            student_name=student_name,
+            submission_data=data,
+            status_url=status_url,
+            school=school,
+        )
+    except Exception:
+        logger.exception("Failed to send applicant confirmation email")
+    finally:
+        close_shared_email_connections()
+
+
+def _send_submission_emails_async(*args):
+    """Thread target for _send_submission_emails; cleans up the thread's DB connection."""
+    try:
+        _send_submission_emails(*args)
+    finally:
+        close_old_connections()
+
+
+# Bounded pool for EMAIL_ASYNC sends: a burst of submissions queues behind a few SMTP
+# workers instead of opening one thread (and SMTP/DB connection) per request. Worker
+# threads are joined at interpreter exit, so queued emails are still sent on shutdown.
+_EMAIL_EXECUTOR_WORKERS = 4
+_email_executor: ThreadPoolExecutor | None = None
+_email_executor_lock = threading.Lock()
+
+
+def _get_email_executor() -> ThreadPoolExecutor:
+    global _email_executor
+    if _email_executor is None:
+        with _email_executor_lock:
+            if _email_executor is None:
+                _email_executor = ThreadPoolExecutor(
+                    max_workers=_EMAIL_EXECUTOR_WORKERS,
+                    thread_name_prefix="submission-email",
+                )
+    return _email_executor
+
+
+def _dispatch_submission_emails(request, school, submission, raw, school_name):
+    """Send the new-submission emails, off the request path when settings.EMAIL_ASYNC is on.
+
+    Everything the emails need is computed here, in the request thread. Returns the
+    pool future when the sends were queued, None when they ran inline.
+    """
+    status_url = ""
+    if school.features.family_portal_enabled:
+        from core.services.url_builder import app_reverse
+        status_url = app_reverse("family_status", kwargs={"school_slug": school.slug, "token": submission.status_token})
+    args = (
+        school,
+        submission.id,
+        submission.public_id,
+        submission.student_display_name(),
+        dict(submission.data or {}),
+        raw,
+        school_name,
+        status_url,
+    )
+    if getattr(settings, "EMAIL_ASYNC", False):
+        return _get_email_executor().submit(_send_submission_emails_async, *args)
+    _send_submission_emails(*args, request=request)
+    return None
+
+
 def _send_lead_notifications_async(school, lead, raw, lead_cfg, school_display_name):
     """Send lead admin + confirmation emails in a background thread.
 
@@ -1306,12 +1318,12 @@ def school_lead_form_view(request, school_slug, form_key=None):
     if not config:
         raise Http404
 
-    school = _get_or_create_school_from_config(school_slug, config, merge_branding(config.branding))
+    school = _get_or_create_school_from_config(school_slug, config, _config_branding(config))
     config = apply_overrides(config, school.config_overrides)
     if not school.is_active:
         raise Http404
 
-    branding = merge_branding(config.branding)
+    branding = _config_branding(config)
     if not school.features.custom_branding_enabled:
         branding["custom_css"] = None
         branding["custom_js"] = None
@@ -1568,14 +1580,14 @@ def lead_capture_view(request, school_slug):
     if not config:
         raise Http404
 
-    school = _get_or_create_school_from_config(school_slug, config, merge_branding(config.branding))
+    school = _get_or_create_school_from_config(school_slug, config, _config_branding(config))
     config = apply_overrides(config, school.config_overrides)
     if not school.is_active:
         raise Http404
     if not school.features.leads_enabled:
         raise Http404
 
-    branding = merge_branding(config.branding)
+    branding = _config_branding(config)
 
     # Block expired-trial schools from capturing new leads (GET and POST)
     if school.is_trial_expired:
@@ -1706,7 +1718,7 @@ def lead_capture_success_view(request, school_slug):
     if not config:
         raise Http404
 
-    branding = merge_branding(config.branding)
+    branding = _config_branding(config)
     leads_cfg = config.raw.get("leads") or {}
     success_message = leads_cfg.get("success_message") or "Thanks for your interest! We'll be in touch soon."
     apply_url = reverse("apply", kwargs={"school_slug": school_slug})
@@ -1751,7 +1763,7 @@ def family_status_view(request, school_slug: str, token: str):
     except Exception:
         pass  # Treat missing config as no branding / default status labels
 
-    branding = merge_branding(getattr(config, "branding", None) if config else None)
+    branding = _config_branding(config)
     school_name = (getattr(config, "display_name", None) if config else None) or school.display_name or school.slug
 
     # submission.status is already the human-readable string (matches YAML list entries).
@@ -1841,7 +1853,7 @@ def school_status_login_view(request, school_slug: str):
         config = load_school_config(school_slug)
     except Exception:
         pass
-    branding = merge_branding(getattr(config, "branding", None) if config else None)
+    branding = _config_branding(config)
     school_name = (getattr(config, "display_name", None) if config else None) or school.display_name or school.slug
 
     error = None
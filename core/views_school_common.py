@@ -55,6 +55,7 @@ from .services.admin_themes import (
 from .services.config_loader import (
     find_email_field_key,
     get_forms,
+    get_option_label_map,
     get_program_options,
     load_school_config,
     PROGRAM_FIELD_KEYS,
@@ -741,7 +742,7 @@ def school_reports_view(request, school_slug: str):
         )
 
     config = _safe_load_school_config(school_slug)
-    label_map = build_option_label_map(config.form) if config else {}
+    label_map = get_option_label_map(config)
 
     # ── Date range ────────────────────────────────────────────────────────────
     range_raw = (request.GET.get("range") or "30").strip()
@@ -783,7 +784,8 @@ def school_reports_view(request, school_slug: str):
     # ── CSV export ────────────────────────────────────────────────────────────
     export = request.GET.get("export", "").lower() in {"1", "true", "csv"}
     if export and csv_enabled:
-        rows = list(apps_this_qs.order_by("-created_at")[:5000])
+        # select_related school+program avoids N+1 from program_display_name().
+        rows = list(apps_this_qs.select_related("school", "program").order_by("-created_at")[:5000])
         all_keys: set = set()
         for s in rows:
             all_keys.update((s.data or {}).keys())
@@ -792,12 +794,13 @@ def school_reports_view(request, school_slug: str):
         resp["Content-Disposition"] = f'attachment; filename="{school.slug}-reports-last{range_days}d.csv"'
         writer = csv.writer(resp)
         writer.writerow(ordered_keys)
+        program_names = Submission.program_display_names(rows, label_map)
         for s in rows:
             data = s.data or {}
             writer.writerow(
                 [s.public_id, timezone.localtime(s.created_at).isoformat(),
                  s.status or "", s.student_display_name(),
-                 s.program_display_name(label_map=label_map) or ""]
+                 program_names[s.id] or ""]
                 + [data.get(k, "") for k in sorted(all_keys)]
             )
         return resp
@@ -1049,9 +1052,10 @@ def school_reports_view(request, school_slug: str):
     }
 
     # ── §4.4: Program Mix (scoped to date range) ──────────────────────────────
-    prog_rows = list(apps_this_qs[:5000])
+    prog_rows = list(apps_this_qs.select_related("school", "program")[:5000])
+    program_names = Submission.program_display_names(prog_rows, label_map)
     prog_strings = [
-        (s.program_display_name(label_map=label_map) or "").strip() or "(none)"
+        (program_names[s.id] or "").strip() or "(none)"
         for s in prog_rows
     ]
     mix_counts = Counter(prog_strings)
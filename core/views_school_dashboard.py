@@ -55,6 +55,7 @@ from .services.config_loader import (
     apply_overrides,
     find_email_field_key,
     get_forms,
+    get_option_label_map,
     get_program_options,
     load_school_config,
     PROGRAM_FIELD_KEYS,
@@ -105,7 +106,7 @@ def school_dashboard_view(request, school_slug: str):
     _log_page_view(request, school, "dashboard")
 
     config = _safe_load_school_config(school_slug)
-    label_map = build_option_label_map(config.form) if config else {}
+    label_map = get_option_label_map(config)
 
     # select_related school+program avoids N+1 from program_display_name().
     all_submissions = Submission.objects.filter(school=school).select_related("school", "program")
@@ -55,6 +55,7 @@ from .services.admin_themes import (
 from .services.config_loader import (
     find_email_field_key,
     get_forms,
+    get_option_label_map,
     get_program_options,
     load_school_config,
     PROGRAM_FIELD_KEYS,
@@ -161,7 +162,7 @@ def school_submissions_view(request, school_slug: str):
 
     config = _safe_load_school_config(school_slug)
     config_raw = getattr(config, "raw", {}) or {}
-    label_map = build_option_label_map(config.form) if (config and config.form) else {}
+    label_map = get_option_label_map(config)
 
     workflow_filters = get_submission_workflow_filters(config_raw)
 
@@ -938,7 +939,7 @@ def school_submission_create_view(request, school_slug: str):
         return render(request, "school_admin/submission_form.html", ctx)
 
     # POST
-    cleaned, errors = validate_submission(form_cfg, request.POST, files_data={})
+    cleaned, errors = validate_submission(form_cfg, request.POST, files_data={}, config=config)
 
     if errors:
         post_values = _plain_post_values(request.POST, raw_form_cfg)
@@ -1049,7 +1050,7 @@ def school_submission_edit_view(request, school_slug: str, submission_id: int):
         return render(request, "school_admin/submission_form.html", ctx)
 
     # POST
-    cleaned, errors = validate_submission(form_cfg, request.POST, files_data={})
+    cleaned, errors = validate_submission(form_cfg, request.POST, files_data={}, config=config)
 
     if errors:
         post_values = _plain_post_values(request.POST, raw_form_cfg)
@@ -1437,7 +1438,7 @@ def school_submission_bulk_download_view(request, school_slug: str):
     files = list(
         SubmissionFile.objects
         .filter(submission__school=school, submission_id__in=ids)
-        .select_related("submission")
+        .with_context()
         .order_by("submission_id", "id")
     )
 
@@ -1509,6 +1510,7 @@ def school_submission_bulk_print_view(request, school_slug: str):
     submissions = list(
         Submission.objects
         .filter(id__in=ids, school=school)
+        .select_related("school", "program")
         .prefetch_related("files")
         .order_by("school_submission_number")
     )
@@ -8,6 +8,7 @@ Wix, Squarespace automations, or custom HTML forms.
 """
 from __future__ import annotations
 
+import hmac
 import json
 import logging
 
@@ -38,6 +39,11 @@ _ALL_MAPPED = frozenset(
 MAX_PAYLOAD_BYTES = 50 * 1024  # 50 KB hard cap on raw body
 
 
+def _secure_eq(a: str, b: str) -> bool:
+    """Constant-time string comparison; use for every shared-secret check, never ==."""
+    return hmac.compare_digest((a or "").encode(), (b or "").encode())
+
+
 def _pick(data: dict, aliases: tuple) -> str:
     for key in aliases:
         val = data.get(key)
@@ -58,17 +64,12 @@ def webhook_lead_intake_view(request, school_slug, token):
         pass
 
     # ── Token auth — 404 on bad token (no info leakage) ──────────────────────
-    try:
-        school = School.objects.get(
-            slug=school_slug,
-            lead_webhook_token=token,
-            is_active=True,
-        )
-    except School.DoesNotExist:
-        return JsonResponse({"ok": False, "error": "Not found."}, status=404)
+    # Look the school up by slug only and compare the token in constant time,
+    # rather than letting the database compare the secret in its WHERE clause.
+    school = School.objects.filter(slug=school_slug, is_active=True).first()
 
     # Extra guard: reject schools whose token is the empty string
-    if not school.lead_webhook_token:
+    if school is None or not school.lead_webhook_token or not _secure_eq(school.lead_webhook_token, token):
         return JsonResponse({"ok": False, "error": "Not found."}, status=404)
 
     # ── Parse payload: JSON or form-encoded ──────────────────────────────────